@@ -13,14 +13,14 @@ import dearpygui.dearpygui as dpg
 # =============================================================================
 
 _app = None
-_refresh_all = None
+_reload_data = None
 
 
-def init_settings_modal(app_state, refresh_callback):
+def init_settings_modal(app_state, reload_callback):
     """Initialize module with app state reference."""
-    global _app, _refresh_all
+    global _app, _reload_data
     _app = app_state
-    _refresh_all = refresh_callback
+    _reload_data = reload_callback
 
 
 # =============================================================================
@@ -29,20 +29,19 @@ def init_settings_modal(app_state, refresh_callback):
 
 def show_settings_modal():
     """Show settings modal with current app values."""
-    _show_settings_modal_with_values(
-        _app.transition_presets_path,
-        _app.shader_presets_path,
-        _app.shader_folder,
-        _app.game_folder,
-        _app.renpy_exe
-    )
+    if not dpg.does_item_exist("settings_window"):
+        _build_settings_window()
 
+    dpg.set_value("settings_trans_path", _app.transition_presets_path)
+    dpg.set_value("settings_shader_path", _app.shader_presets_path)
+    dpg.set_value("settings_shader_folder", _app.shader_folder)
+    dpg.set_value("settings_game_folder", _app.game_folder)
+    dpg.set_value("settings_renpy_exe", _app.renpy_exe)
+    dpg.show_item("settings_window")
 
-def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, game_folder, renpy_exe):
-    """Show settings modal with specific values."""
-    if dpg.does_item_exist("settings_window"):
-        dpg.delete_item("settings_window")
 
+def _build_settings_window():
+    """Build the settings window once; it is hidden and shown from then on."""
     with dpg.window(
         label="Settings",
         modal=True,
@@ -50,7 +49,7 @@ def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, gam
         height=400,
         pos=[280, 160],
         tag="settings_window",
-        on_close=lambda: dpg.delete_item("settings_window")
+        show=False
     ):
         dpg.add_text("Configure file paths")
         dpg.add_separator()
@@ -59,7 +58,6 @@ def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, gam
         dpg.add_text("Transition Presets JSON:")
         with dpg.group(horizontal=True):
             dpg.add_input_text(
-                default_value=trans_path,
                 tag="settings_trans_path",
                 width=500
             )
@@ -73,7 +71,6 @@ def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, gam
         dpg.add_text("Shader Presets JSON:")
         with dpg.group(horizontal=True):
             dpg.add_input_text(
-                default_value=shader_path,
                 tag="settings_shader_path",
                 width=500
             )
@@ -87,7 +84,6 @@ def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, gam
         dpg.add_text("Shader .rpy Folder:")
         with dpg.group(horizontal=True):
             dpg.add_input_text(
-                default_value=shader_folder,
                 tag="settings_shader_folder",
                 width=500
             )
@@ -101,7 +97,6 @@ def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, gam
         dpg.add_text("Game Folder:")
         with dpg.group(horizontal=True):
             dpg.add_input_text(
-                default_value=game_folder,
                 tag="settings_game_folder",
                 width=500
             )
@@ -115,7 +110,6 @@ def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, gam
         dpg.add_text("Ren'Py Executable:")
         with dpg.group(horizontal=True):
             dpg.add_input_text(
-                default_value=renpy_exe,
                 tag="settings_renpy_exe",
                 width=500
             )
@@ -132,7 +126,7 @@ def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, gam
             dpg.add_button(label="Apply", callback=_settings_apply, width=100)
             dpg.add_button(
                 label="Cancel",
-                callback=lambda: dpg.delete_item("settings_window"),
+                callback=lambda: dpg.hide_item("settings_window"),
                 width=100
             )
 
@@ -143,160 +137,77 @@ def _show_settings_modal_with_values(trans_path, shader_path, shader_folder, gam
 
 def _settings_browse_file(target_tag: str):
     """Open file browser and set result to target input."""
-    current_values = _get_current_values(target_tag)
-
-    def callback(sender, app_data):
-        selected_path = None
-        if app_data and "file_path_name" in app_data:
-            selected_path = app_data["file_path_name"]
-        dpg.delete_item("file_dialog")
-        _reopen_settings_with_values(current_values, selected_path)
-
-    def cancel_callback(sender, app_data):
-        dpg.delete_item("file_dialog")
-        _reopen_settings_with_values(current_values, None)
-
-    dpg.delete_item("settings_window")
-
-    if dpg.does_item_exist("file_dialog"):
-        dpg.delete_item("file_dialog")
-
-    start_path = current_values.get(target_tag.replace("settings_", ""), "")
-    if start_path:
-        start_path = os.path.dirname(start_path)
-
-    with dpg.file_dialog(
-        callback=callback,
-        cancel_callback=cancel_callback,
-        tag="file_dialog",
-        width=700,
-        height=400,
-        show=True,
-        default_path=start_path or "."
-    ):
-        dpg.add_file_extension(".json", color=(0, 255, 0, 255))
-        dpg.add_file_extension(".exe", color=(0, 255, 255, 255))
-        dpg.add_file_extension(".*")
+    start_path = os.path.dirname(dpg.get_value(target_tag))
+    _open_browse_dialog(target_tag, "file_dialog", start_path, [
+        (".json", (0, 255, 0, 255)),
+        (".exe", (0, 255, 255, 255)),
+        (".*", None),
+    ])
 
 
 def _settings_browse_exe(target_tag: str):
     """Open executable browser."""
-    current_values = _get_current_values(target_tag)
-
-    def callback(sender, app_data):
-        selected_path = None
-        if app_data and "file_path_name" in app_data:
-            selected_path = app_data["file_path_name"]
-        dpg.delete_item("exe_dialog")
-        _reopen_settings_with_values(current_values, selected_path)
-
-    def cancel_callback(sender, app_data):
-        dpg.delete_item("exe_dialog")
-        _reopen_settings_with_values(current_values, None)
-
-    dpg.delete_item("settings_window")
-
-    if dpg.does_item_exist("exe_dialog"):
-        dpg.delete_item("exe_dialog")
-
-    start_path = current_values["renpy_exe"]
-    if start_path:
-        start_path = os.path.dirname(start_path)
-
-    with dpg.file_dialog(
-        callback=callback,
-        cancel_callback=cancel_callback,
-        tag="exe_dialog",
-        width=700,
-        height=400,
-        show=True,
-        default_path=start_path or "."
-    ):
-        dpg.add_file_extension(".exe", color=(0, 255, 255, 255))
-        dpg.add_file_extension(".app", color=(0, 255, 255, 255))
-        dpg.add_file_extension(".*")
+    start_path = os.path.dirname(dpg.get_value(target_tag))
+    _open_browse_dialog(target_tag, "exe_dialog", start_path, [
+        (".exe", (0, 255, 255, 255)),
+        (".app", (0, 255, 255, 255)),
+        (".*", None),
+    ])
 
 
 def _settings_browse_folder(target_tag: str):
     """Open folder browser."""
-    current_values = _get_current_values(target_tag)
-
-    def callback(sender, app_data):
-        selected_path = None
-        if app_data and "file_path_name" in app_data:
-            selected_path = app_data["file_path_name"]
-        dpg.delete_item("folder_dialog")
-        _reopen_settings_with_values(current_values, selected_path)
-
-    def cancel_callback(sender, app_data):
-        dpg.delete_item("folder_dialog")
-        _reopen_settings_with_values(current_values, None)
-
-    dpg.delete_item("settings_window")
-
-    if dpg.does_item_exist("folder_dialog"):
-        dpg.delete_item("folder_dialog")
-
-    start_path = ""
-    if target_tag == "settings_shader_folder":
-        start_path = current_values["shader_folder"]
-    elif target_tag == "settings_game_folder":
-        start_path = current_values["game_folder"]
-
-    with dpg.file_dialog(
-        callback=callback,
-        cancel_callback=cancel_callback,
-        tag="folder_dialog",
-        directory_selector=True,
-        width=700,
-        height=400,
-        show=True,
-        default_path=start_path or "."
-    ):
-        pass
+    start_path = dpg.get_value(target_tag)
+    _open_browse_dialog(target_tag, "folder_dialog", start_path, [],
+                        directory_selector=True)
+
+
+def _open_browse_dialog(target_tag: str, dialog_tag: str, start_path: str,
+                        extensions: list, directory_selector: bool = False):
+    """Hide the settings window while a file dialog picks a path for target_tag.
+
+    The settings inputs keep their values while hidden, so only the target
+    input is written and the window is shown again as it was. Each dialog
+    is built on first use and reused afterwards.
+    """
+    if not dpg.does_item_exist(dialog_tag):
+        with dpg.file_dialog(
+            callback=_on_browse_selected,
+            cancel_callback=_on_browse_closed,
+            tag=dialog_tag,
+            directory_selector=directory_selector,
+            width=700,
+            height=400,
+            show=False
+        ):
+            for extension, color in extensions:
+                if color:
+                    dpg.add_file_extension(extension, color=color)
+                else:
+                    dpg.add_file_extension(extension)
+
+    dpg.hide_item("settings_window")
+    dpg.configure_item(dialog_tag, user_data=target_tag,
+                       default_path=start_path or ".", show=True)
+
+
+def _on_browse_selected(sender, app_data, user_data):
+    """File dialog callback: write the chosen path into the target input."""
+    if app_data and "file_path_name" in app_data:
+        dpg.set_value(user_data, app_data["file_path_name"])
+    _on_browse_closed(sender, app_data)
+
+
+def _on_browse_closed(sender, app_data, user_data=None):
+    """Hide a browse dialog and bring the settings window back."""
+    dpg.hide_item(sender)
+    dpg.show_item("settings_window")
 
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
-def _get_current_values(target_tag: str) -> dict:
-    """Get current values from settings inputs."""
-    return {
-        "trans": dpg.get_value("settings_trans_path"),
-        "shader": dpg.get_value("settings_shader_path"),
-        "shader_folder": dpg.get_value("settings_shader_folder"),
-        "game_folder": dpg.get_value("settings_game_folder"),
-        "renpy_exe": dpg.get_value("settings_renpy_exe"),
-        "target": target_tag
-    }
-
-
-def _reopen_settings_with_values(values: dict, new_path: str):
-    """Reopen settings modal with preserved values."""
-    target = values["target"]
-
-    if new_path:
-        if target == "settings_trans_path":
-            values["trans"] = new_path
-        elif target == "settings_shader_path":
-            values["shader"] = new_path
-        elif target == "settings_shader_folder":
-            values["shader_folder"] = new_path
-        elif target == "settings_game_folder":
-            values["game_folder"] = new_path
-        elif target == "settings_renpy_exe":
-            values["renpy_exe"] = new_path
-
-    _show_settings_modal_with_values(
-        values["trans"],
-        values["shader"],
-        values["shader_folder"],
-        values["game_folder"],
-        values["renpy_exe"]
-    )
-
-
 def _settings_apply():
     """Apply settings and reload data."""
     _app.transition_presets_path = dpg.get_value("settings_trans_path")
@@ -312,8 +223,9 @@ def _settings_apply():
         if _app.status_bar:
             _app.status_bar.set_status("Error saving settings!", (255, 100, 100))
 
-    _app.load_data()
-    if _refresh_all:
-        _refresh_all()
+    dpg.hide_item("settings_window")
 
-    dpg.delete_item("settings_window")
+    # Loads on a worker thread (queued behind a running load) and refreshes
+    # the UI when done
+    if _reload_data:
+        _reload_data()
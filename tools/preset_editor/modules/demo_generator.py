@@ -11,6 +11,34 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
+# options.rpy for the standalone test game (see DemoGenerator.save_test_game)
+_OPTIONS_TEMPLATE = '''## options.rpy - Test game configuration
+
+define config.name = "Preset Editor Test"
+define build.name = "PresetTest"
+define config.version = "1.0"
+
+define config.screen_width = {width}
+define config.screen_height = {height}
+
+define config.save_directory = "preset_editor_test"
+'''
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already holds exactly that text.
+
+    Returns True if the file was written.
+    """
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(text, encoding='utf-8')
+    return True
+
+
 @dataclass
 class DemoItem:
     """A single demo item (transition + shader + text_shader combination).
@@ -430,9 +458,7 @@ label {self.label_name}:
             if output_dir:
                 Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-            script = self.generate_script()
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(script)
+            _write_if_changed(Path(output_path), self.generate_script())
             return True
         except Exception as e:
             print(f"DemoGenerator: Error saving script: {e}")
@@ -487,26 +513,18 @@ label {self.label_name}:
             game_path = Path(game_folder)
             game_path.mkdir(parents=True, exist_ok=True)
 
-            # script.rpy
-            script_path = game_path / "script.rpy"
-            with open(script_path, 'w', encoding='utf-8') as f:
-                f.write(self.generate_test_game_script())
+            # Build both files before touching either, so a failure can't
+            # leave a half-updated test game behind
+            script = self.generate_test_game_script()
 
             # options.rpy with configured dimensions
-            options_path = game_path / "options.rpy"
-            with open(options_path, 'w', encoding='utf-8') as f:
-                f.write(f'''## options.rpy - Test game configuration
-
-define config.name = "Preset Editor Test"
-define build.name = "PresetTest"
-define config.version = "1.0"
-
-define config.screen_width = {self.screen_width}
-define config.screen_height = {self.screen_height}
-
-define config.save_directory = "preset_editor_test"
-''')
+            options = _OPTIONS_TEMPLATE.format(
+                width=self.screen_width,
+                height=self.screen_height
+            )
 
+            _write_if_changed(game_path / "script.rpy", script)
+            _write_if_changed(game_path / "options.rpy", options)
             return True
         except Exception as e:
             print(f"DemoGenerator: Error saving test game: {e}")
@@ -7,9 +7,123 @@ Maintains undo/redo history for all changes.
 
 import json
 import copy
+import math
+import os
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+try:
+    import orjson  # Optional: much faster JSON views and undo snapshots
+except ImportError:
+    orjson = None
+
+
+def to_display_json(data: Any) -> str:
+    """Pretty-print data for the read-only JSON panels.
+
+    Uses orjson when installed, falling back to the stdlib encoder. Both
+    paths keep non-ASCII text unescaped so the view reads the same either way;
+    data holding NaN or Infinity goes to the stdlib, which shows them as stored.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse JSON file contents, with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals; let the stdlib parse or report it
+    return json.loads(raw)
+
+
+def _file_stamp(filepath: str) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_json_file(filepath: str) -> Tuple[Dict, Optional[tuple]]:
+    """Read and parse one JSON file; returns (data, stamp), or ({}, None) on error."""
+    try:
+        stamp = _file_stamp(filepath)
+        with open(filepath, 'rb') as f:
+            return _parse_json(f.read()), stamp
+    except FileNotFoundError:
+        print(f"JsonManager: File not found: {filepath}")
+    except json.JSONDecodeError as e:
+        print(f"JsonManager: Invalid JSON in {filepath}: {e}")
+    except Exception as e:
+        print(f"JsonManager: Error loading {filepath}: {e}")
+    return {}, None
+
+
+def _has_non_finite(data: Any) -> bool:
+    """True if data holds NaN or +/-Infinity, which orjson writes as null."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(v) for v in data.values())
+    if isinstance(data, list):
+        return any(_has_non_finite(v) for v in data)
+    return False
+
+
+def _clone(data: Any) -> Any:
+    """Deep-copy JSON data for undo snapshots and duplicated presets.
+
+    An orjson round trip is several times faster than copy.deepcopy on
+    nested dicts; anything it can't encode, or would turn into null
+    (NaN, Infinity), falls back to deepcopy.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.loads(orjson.dumps(data))
+        except TypeError:
+            pass
+    return copy.deepcopy(data)
+
+
+def _moved_order(order: List[str], names: List[str], direction: str) -> List[str]:
+    """Return order with names moved together in one pass.
+
+    'top'/'bottom' gather names at that end in the given order; 'up'/'down'
+    shift each by one place, stopping against another moved name.
+    """
+    moving = set(names)
+    if direction in ("top", "bottom"):
+        present = set(order)
+        picked = list(dict.fromkeys(n for n in names if n in present))
+        rest = [n for n in order if n not in moving]
+        return picked + rest if direction == "top" else rest + picked
+
+    new_order = list(order)
+    if direction == "up":
+        for i in range(1, len(new_order)):
+            if new_order[i] in moving and new_order[i - 1] not in moving:
+                new_order[i - 1], new_order[i] = new_order[i], new_order[i - 1]
+    elif direction == "down":
+        for i in range(len(new_order) - 2, -1, -1):
+            if new_order[i] in moving and new_order[i + 1] not in moving:
+                new_order[i], new_order[i + 1] = new_order[i + 1], new_order[i]
+    return new_order
+
+
+def _renamed(presets: Dict, old_name: str, new_name: str) -> Dict:
+    """Return presets with old_name's key replaced by new_name, keeping its place."""
+    return {new_name if key == old_name else key: value for key, value in presets.items()}
 
 
 @dataclass
@@ -33,6 +147,7 @@ class JsonManager:
     """
 
     MAX_UNDO_LEVELS = 50
+    UNDO_COALESCE_SECONDS = 0.1  # Same-field edits closer than this share an undo entry
 
     def __init__(self):
         self.transition_path: str = ""
@@ -49,52 +164,121 @@ class JsonManager:
         self._auto_save = True
         self._on_change_callbacks: List[Callable] = []
 
+        # Incremented whenever the set or order of preset names may have
+        # changed, so views can skip re-syncing name lists when it hasn't
+        self.data_version = 0
+
+        # Incremented on every change notification (any data change)
+        self.revision = 0
+
+        # Section -> (data_version, preset names) for get_*_names()
+        self._names_cache: Dict[str, tuple] = {}
+
+        # Batching (see batch())
+        self._batch_depth = 0
+        self._batch_changed = False
+        self._batch_saves: set = set()
+
+        # (key, time, UndoState) of the last coalescable edit (see push_undo_coalesced)
+        self._coalesce = None
+
+        # Path -> file stamp when the in-memory data last matched the file;
+        # load() skips re-reading files whose stamp is unchanged
+        self._file_stamps: Dict[str, tuple] = {}
+
     def set_paths(self, transition_path: str, shader_path: str, textshader_path: str = ""):
         """Set the paths to JSON files."""
+        # A stamp only vouches for the data loaded from that path; after a
+        # switch the in-memory data belongs to another file
+        if (transition_path, shader_path, textshader_path) != (
+                self.transition_path, self.shader_path, self.textshader_path):
+            self._file_stamps.clear()
         self.transition_path = transition_path
         self.shader_path = shader_path
         self.textshader_path = textshader_path
 
-    def load(self) -> bool:
-        """Load all JSON files."""
+    def reader(self, transition_path: str, shader_path: str,
+               textshader_path: str = "") -> Callable[[], Dict[str, Optional[tuple]]]:
+        """Return a function that reads the given JSON files for load(preread=...).
+
+        Call on the UI thread; the paths take effect only when the result is
+        applied with set_paths() and load(). The returned function only
+        touches the file system, so it can run on a worker thread. Its
+        result maps each path to (data, stamp), or to None if the file still
+        matched its stamp.
+        """
+        # Files whose section data came from them can skip an unchanged read;
+        # empty sections are always re-read, as in _reload_json
+        known = {}
+        for path, old_path, current in ((transition_path, self.transition_path, self.transition_data),
+                                        (shader_path, self.shader_path, self.shader_data),
+                                        (textshader_path, self.textshader_path, self.textshader_data)):
+            if path:
+                known[path] = self._file_stamps.get(path) if path == old_path and current else None
+
+        def read() -> Dict[str, Optional[tuple]]:
+            result = {}
+            for path, stamp in known.items():
+                if stamp is not None and _file_stamp(path) == stamp:
+                    result[path] = None
+                else:
+                    result[path] = _read_json_file(path)
+            return result
+
+        return read
+
+    def load(self, preread: Optional[Dict[str, Optional[tuple]]] = None) -> bool:
+        """Load all JSON files.
+
+        preread is the result of a reader() function; files changed since it
+        ran (or missing from it) are read again here.
+        """
         success = True
 
         if self.transition_path:
-            self.transition_data = self._load_json(self.transition_path)
+            self.transition_data = self._reload_json(self.transition_path, self.transition_data, preread)
             if not self.transition_data:
                 success = False
 
         if self.shader_path:
-            self.shader_data = self._load_json(self.shader_path)
+            self.shader_data = self._reload_json(self.shader_path, self.shader_data, preread)
             if not self.shader_data:
                 success = False
 
         if self.textshader_path:
-            self.textshader_data = self._load_json(self.textshader_path)
+            self.textshader_data = self._reload_json(self.textshader_path, self.textshader_data, preread)
             if not self.textshader_data:
                 success = False
 
         # Clear undo/redo on load
         self.undo_stack.clear()
         self.redo_stack.clear()
+        self.data_version += 1
 
         self._notify_change()
         return success
 
+    def _reload_json(self, filepath: str, current: Dict,
+                     preread: Optional[Dict[str, Optional[tuple]]] = None) -> Dict:
+        """Return current if the file is unchanged since it matched, else load it."""
+        stamp = _file_stamp(filepath)
+        if stamp is not None and current and self._file_stamps.get(filepath) == stamp:
+            return current
+        if preread and preread.get(filepath):
+            data, read_stamp = preread[filepath]
+            # Only trust a pre-read that still matches the file on disk
+            if read_stamp is not None and read_stamp == stamp:
+                self._file_stamps[filepath] = stamp
+                return data
+        return self._load_json(filepath)
+
     def _load_json(self, filepath: str) -> Dict:
         """Load a single JSON file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"JsonManager: File not found: {filepath}")
-            return {}
-        except json.JSONDecodeError as e:
-            print(f"JsonManager: Invalid JSON in {filepath}: {e}")
-            return {}
-        except Exception as e:
-            print(f"JsonManager: Error loading {filepath}: {e}")
-            return {}
+        self._file_stamps.pop(filepath, None)
+        data, stamp = _read_json_file(filepath)
+        if stamp is not None:
+            self._file_stamps[filepath] = stamp
+        return data
 
     def save(self, which: str = "all") -> bool:
         """Save JSON files.
@@ -102,6 +286,11 @@ class JsonManager:
         Args:
             which: "transition", "shader", "textshader", or "all"
         """
+        if self._batch_depth:
+            # Written once when the outermost batch() exits
+            self._batch_saves.add(which)
+            return True
+
         success = True
 
         if which in ("transition", "all", "both") and self.transition_path:
@@ -142,6 +331,7 @@ class JsonManager:
     def _save_json(self, filepath: str, data: Dict) -> bool:
         """Save data to a JSON file."""
         print(f"[DEBUG] _save_json called: filepath={filepath}")
+        self._file_stamps.pop(filepath, None)
         try:
             # Clean invalid keys before saving
             data = self._clean_params(data)
@@ -155,6 +345,9 @@ class JsonManager:
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=4, ensure_ascii=False)
+            stamp = _file_stamp(filepath)
+            if stamp is not None:
+                self._file_stamps[filepath] = stamp
             print(f"[DEBUG] _save_json SUCCESS: {filepath}")
             return True
         except Exception as e:
@@ -167,10 +360,13 @@ class JsonManager:
 
     def push_undo(self, description: str = ""):
         """Push current state to undo stack."""
+        if not self._auto_save:
+            # The data is about to diverge from disk until the next save
+            self._file_stamps.clear()
         state = UndoState(
-            transition_data=copy.deepcopy(self.transition_data),
-            shader_data=copy.deepcopy(self.shader_data),
-            textshader_data=copy.deepcopy(self.textshader_data),
+            transition_data=_clone(self.transition_data),
+            shader_data=_clone(self.shader_data),
+            textshader_data=_clone(self.textshader_data),
             description=description
         )
         self.undo_stack.append(state)
@@ -182,6 +378,21 @@ class JsonManager:
         # Clear redo stack on new change
         self.redo_stack.clear()
 
+    def push_undo_coalesced(self, description: str, key: Any):
+        """Push an undo entry unless the previous one is for the same rapid edit.
+
+        Edits sharing a key less than UNDO_COALESCE_SECONDS apart (a spinner
+        drag, typing in a field) all undo back to the state before the first.
+        """
+        now = time.monotonic()
+        last = self._coalesce
+        if (last and last[0] == key and now - last[1] < self.UNDO_COALESCE_SECONDS
+                and self.undo_stack and self.undo_stack[-1] is last[2]):
+            self._coalesce = (key, now, last[2])
+            return
+        self.push_undo(description)
+        self._coalesce = (key, now, self.undo_stack[-1])
+
     def undo(self) -> bool:
         """Undo last change. Returns True if successful."""
         if not self.undo_stack:
@@ -189,9 +400,9 @@ class JsonManager:
 
         # Push current state to redo
         current = UndoState(
-            transition_data=copy.deepcopy(self.transition_data),
-            shader_data=copy.deepcopy(self.shader_data),
-            textshader_data=copy.deepcopy(self.textshader_data)
+            transition_data=_clone(self.transition_data),
+            shader_data=_clone(self.shader_data),
+            textshader_data=_clone(self.textshader_data)
         )
         self.redo_stack.append(current)
 
@@ -200,6 +411,8 @@ class JsonManager:
         self.transition_data = prev.transition_data
         self.shader_data = prev.shader_data
         self.textshader_data = prev.textshader_data
+        self.data_version += 1
+        self._file_stamps.clear()
 
         if self._auto_save:
             self.save()
@@ -214,9 +427,9 @@ class JsonManager:
 
         # Push current state to undo
         current = UndoState(
-            transition_data=copy.deepcopy(self.transition_data),
-            shader_data=copy.deepcopy(self.shader_data),
-            textshader_data=copy.deepcopy(self.textshader_data)
+            transition_data=_clone(self.transition_data),
+            shader_data=_clone(self.shader_data),
+            textshader_data=_clone(self.textshader_data)
         )
         self.undo_stack.append(current)
 
@@ -225,6 +438,8 @@ class JsonManager:
         self.transition_data = next_state.transition_data
         self.shader_data = next_state.shader_data
         self.textshader_data = next_state.textshader_data
+        self.data_version += 1
+        self._file_stamps.clear()
 
         if self._auto_save:
             self.save()
@@ -254,10 +469,7 @@ class JsonManager:
 
     def get_transition_names(self) -> List[str]:
         """Get list of transition preset names (excluding comments)."""
-        presets = self.transition_data.get("presets", {})
-        if not presets:
-            return []
-        return [k for k in presets.keys() if k and not k.startswith("_")]
+        return self._cached_names("transition", self.transition_data.get("presets", {}))
 
     def get_transition(self, name: str) -> Optional[Dict]:
         """Get a transition preset by name."""
@@ -271,12 +483,40 @@ class JsonManager:
         if "presets" not in self.transition_data:
             self.transition_data["presets"] = {}
 
+        if name not in self.transition_data["presets"]:
+            self.data_version += 1
         self.transition_data["presets"][name] = data
 
         if self._auto_save:
             self.save("transition")
         self._notify_change()
 
+    @contextmanager
+    def mutate_transition(self, name: str, key: Any = None):
+        """Edit a transition preset in place, then save and notify once.
+
+        Yields the stored preset dict (created if missing). Pass a key, such
+        as the field name, to merge rapid edits into a single undo entry.
+        Saves and notifies even if the with-body raises, so a partial edit
+        is never left unsaved and out of sync with the UI.
+        """
+        description = f"Edit transition: {name}"
+        if key is None:
+            self.push_undo(description)
+        else:
+            self.push_undo_coalesced(description, ("transition", name, key))
+
+        presets = self.transition_data.setdefault("presets", {})
+        if name not in presets:
+            presets[name] = {}
+            self.data_version += 1
+        try:
+            yield presets[name]
+        finally:
+            if self._auto_save:
+                self.save("transition")
+            self._notify_change()
+
     def add_transition(self, name: str, data: Dict):
         """Add a new transition preset."""
         self.push_undo(f"Add transition: {name}")
@@ -285,6 +525,7 @@ class JsonManager:
             self.transition_data["presets"] = {}
 
         self.transition_data["presets"][name] = data
+        self.data_version += 1
 
         if self._auto_save:
             self.save("transition")
@@ -295,6 +536,7 @@ class JsonManager:
         if name in self.transition_data.get("presets", {}):
             self.push_undo(f"Delete transition: {name}")
             del self.transition_data["presets"][name]
+            self.data_version += 1
 
             if self._auto_save:
                 self.save("transition")
@@ -310,6 +552,7 @@ class JsonManager:
         for name in names:
             if name in self.transition_data.get("presets", {}):
                 del self.transition_data["presets"][name]
+                self.data_version += 1
 
         if self._auto_save:
             self.save("transition")
@@ -323,7 +566,8 @@ class JsonManager:
 
         self.push_undo(f"Rename transition: {old_name} -> {new_name}")
 
-        presets[new_name] = presets.pop(old_name)
+        self.transition_data["presets"] = _renamed(presets, old_name, new_name)
+        self.data_version += 1
 
         if self._auto_save:
             self.save("transition")
@@ -338,7 +582,8 @@ class JsonManager:
 
         self.push_undo(f"Duplicate transition: {name}")
 
-        presets[new_name] = copy.deepcopy(presets[name])
+        presets[new_name] = _clone(presets[name])
+        self.data_version += 1
 
         if self._auto_save:
             self.save("transition")
@@ -351,7 +596,7 @@ class JsonManager:
 
         direction: 'top', 'up', 'down', 'bottom'
         """
-        names = self.get_transition_names()
+        names = list(self.get_transition_names())
         if name not in names:
             return False
 
@@ -378,6 +623,21 @@ class JsonManager:
         self._notify_change()
         return True
 
+    def move_transitions(self, names: List[str], direction: str) -> bool:
+        """Move several transitions at once with one undo entry and one save."""
+        order = self.get_transition_names()
+        new_order = _moved_order(order, names, direction)
+        if new_order == order:
+            return False
+
+        self.push_undo(f"Move {len(names)} transitions {direction}")
+        self._reorder_transitions(new_order)
+
+        if self._auto_save:
+            self.save("transition")
+        self._notify_change()
+        return True
+
     def _reorder_transitions(self, new_order: List[str]):
         """Reorder transitions to match the given list."""
         old_presets = self.transition_data.get("presets", {})
@@ -394,6 +654,7 @@ class JsonManager:
                 new_presets[name] = old_presets[name]
 
         self.transition_data["presets"] = new_presets
+        self.data_version += 1
 
     # =========================================================================
     # Shader Presets
@@ -401,10 +662,7 @@ class JsonManager:
 
     def get_shader_names(self) -> List[str]:
         """Get list of shader preset names (excluding comments)."""
-        presets = self.shader_data.get("shader_presets", {})
-        if not presets:
-            return []
-        return [k for k in presets.keys() if k and not k.startswith("_")]
+        return self._cached_names("shader", self.shader_data.get("shader_presets", {}))
 
     def get_shader(self, name: str) -> Optional[Dict]:
         """Get a shader preset by name."""
@@ -419,6 +677,8 @@ class JsonManager:
         if "shader_presets" not in self.shader_data:
             self.shader_data["shader_presets"] = {}
 
+        if name not in self.shader_data["shader_presets"]:
+            self.data_version += 1
         self.shader_data["shader_presets"][name] = data
 
         if self._auto_save:
@@ -426,6 +686,29 @@ class JsonManager:
             print(f"[DEBUG] save('shader') returned: {result}")
         self._notify_change()
 
+    @contextmanager
+    def mutate_shader(self, name: str, key: Any = None):
+        """Edit a shader preset in place, then save and notify once.
+
+        Same contract as mutate_transition().
+        """
+        description = f"Edit shader: {name}"
+        if key is None:
+            self.push_undo(description)
+        else:
+            self.push_undo_coalesced(description, ("shader", name, key))
+
+        presets = self.shader_data.setdefault("shader_presets", {})
+        if name not in presets:
+            presets[name] = {}
+            self.data_version += 1
+        try:
+            yield presets[name]
+        finally:
+            if self._auto_save:
+                self.save("shader")
+            self._notify_change()
+
     def add_shader(self, name: str, data: Dict):
         """Add a new shader preset."""
         self.push_undo(f"Add shader: {name}")
@@ -434,6 +717,7 @@ class JsonManager:
             self.shader_data["shader_presets"] = {}
 
         self.shader_data["shader_presets"][name] = data
+        self.data_version += 1
 
         if self._auto_save:
             self.save("shader")
@@ -444,6 +728,7 @@ class JsonManager:
         if name in self.shader_data.get("shader_presets", {}):
             self.push_undo(f"Delete shader: {name}")
             del self.shader_data["shader_presets"][name]
+            self.data_version += 1
 
             if self._auto_save:
                 self.save("shader")
@@ -459,6 +744,7 @@ class JsonManager:
         for name in names:
             if name in self.shader_data.get("shader_presets", {}):
                 del self.shader_data["shader_presets"][name]
+                self.data_version += 1
 
         if self._auto_save:
             self.save("shader")
@@ -472,7 +758,8 @@ class JsonManager:
 
         self.push_undo(f"Rename shader: {old_name} -> {new_name}")
 
-        presets[new_name] = presets.pop(old_name)
+        self.shader_data["shader_presets"] = _renamed(presets, old_name, new_name)
+        self.data_version += 1
 
         if self._auto_save:
             self.save("shader")
@@ -487,7 +774,8 @@ class JsonManager:
 
         self.push_undo(f"Duplicate shader: {name}")
 
-        presets[new_name] = copy.deepcopy(presets[name])
+        presets[new_name] = _clone(presets[name])
+        self.data_version += 1
 
         if self._auto_save:
             self.save("shader")
@@ -496,7 +784,7 @@ class JsonManager:
 
     def move_shader(self, name: str, direction: str) -> bool:
         """Move a shader in the list order."""
-        names = self.get_shader_names()
+        names = list(self.get_shader_names())
         if name not in names:
             return False
 
@@ -523,6 +811,21 @@ class JsonManager:
         self._notify_change()
         return True
 
+    def move_shaders(self, names: List[str], direction: str) -> bool:
+        """Move several shaders at once with one undo entry and one save."""
+        order = self.get_shader_names()
+        new_order = _moved_order(order, names, direction)
+        if new_order == order:
+            return False
+
+        self.push_undo(f"Move {len(names)} shaders {direction}")
+        self._reorder_shaders(new_order)
+
+        if self._auto_save:
+            self.save("shader")
+        self._notify_change()
+        return True
+
     def _reorder_shaders(self, new_order: List[str]):
         """Reorder shaders to match the given list."""
         old_presets = self.shader_data.get("shader_presets", {})
@@ -539,6 +842,7 @@ class JsonManager:
                 new_presets[name] = old_presets[name]
 
         self.shader_data["shader_presets"] = new_presets
+        self.data_version += 1
 
     # =========================================================================
     # Text Shader Presets
@@ -546,10 +850,7 @@ class JsonManager:
 
     def get_textshader_names(self) -> List[str]:
         """Get list of text shader preset names (excluding comments)."""
-        presets = self.textshader_data.get("presets", {})
-        if not presets:
-            return []
-        return [k for k in presets.keys() if k and not k.startswith("_")]
+        return self._cached_names("textshader", self.textshader_data.get("presets", {}))
 
     def get_textshader(self, name: str) -> Optional[Dict]:
         """Get a text shader preset by name."""
@@ -564,6 +865,8 @@ class JsonManager:
         if "presets" not in self.textshader_data:
             self.textshader_data["presets"] = {}
 
+        if name not in self.textshader_data["presets"]:
+            self.data_version += 1
         self.textshader_data["presets"][name] = data
 
         if self._auto_save:
@@ -579,6 +882,7 @@ class JsonManager:
             self.textshader_data["presets"] = {}
 
         self.textshader_data["presets"][name] = data
+        self.data_version += 1
 
         if self._auto_save:
             self.save("textshader")
@@ -589,6 +893,7 @@ class JsonManager:
         if name in self.textshader_data.get("presets", {}):
             self.push_undo(f"Delete text shader: {name}")
             del self.textshader_data["presets"][name]
+            self.data_version += 1
 
             if self._auto_save:
                 self.save("textshader")
@@ -604,6 +909,7 @@ class JsonManager:
         for name in names:
             if name in self.textshader_data.get("presets", {}):
                 del self.textshader_data["presets"][name]
+                self.data_version += 1
 
         if self._auto_save:
             self.save("textshader")
@@ -617,7 +923,8 @@ class JsonManager:
 
         self.push_undo(f"Rename text shader: {old_name} -> {new_name}")
 
-        presets[new_name] = presets.pop(old_name)
+        self.textshader_data["presets"] = _renamed(presets, old_name, new_name)
+        self.data_version += 1
 
         if self._auto_save:
             self.save("textshader")
@@ -632,7 +939,8 @@ class JsonManager:
 
         self.push_undo(f"Duplicate text shader: {name}")
 
-        presets[new_name] = copy.deepcopy(presets[name])
+        presets[new_name] = _clone(presets[name])
+        self.data_version += 1
 
         if self._auto_save:
             self.save("textshader")
@@ -641,7 +949,7 @@ class JsonManager:
 
     def move_textshader(self, name: str, direction: str) -> bool:
         """Move a text shader in the list order."""
-        names = self.get_textshader_names()
+        names = list(self.get_textshader_names())
         if name not in names:
             return False
 
@@ -668,6 +976,21 @@ class JsonManager:
         self._notify_change()
         return True
 
+    def move_textshaders(self, names: List[str], direction: str) -> bool:
+        """Move several text shaders at once with one undo entry and one save."""
+        order = self.get_textshader_names()
+        new_order = _moved_order(order, names, direction)
+        if new_order == order:
+            return False
+
+        self.push_undo(f"Move {len(names)} text shaders {direction}")
+        self._reorder_textshaders(new_order)
+
+        if self._auto_save:
+            self.save("textshader")
+        self._notify_change()
+        return True
+
     def _reorder_textshaders(self, new_order: List[str]):
         """Reorder text shaders to match the given list."""
         old_presets = self.textshader_data.get("presets", {})
@@ -684,10 +1007,11 @@ class JsonManager:
                 new_presets[name] = old_presets[name]
 
         self.textshader_data["presets"] = new_presets
+        self.data_version += 1
 
     def get_unique_textshader_name(self, base: str = "new_text_preset") -> str:
         """Generate a unique text shader preset name."""
-        existing = self.get_textshader_names()
+        existing = self.textshader_data.get("presets", {})  # dict: O(1) probes
         name = base
         counter = 1
         while name in existing:
@@ -705,19 +1029,78 @@ class JsonManager:
 
     def _notify_change(self):
         """Notify all registered callbacks of a change."""
+        self.revision += 1
+        if self._batch_depth:
+            self._batch_changed = True
+            return
         for callback in self._on_change_callbacks:
             try:
                 callback()
             except Exception as e:
                 print(f"JsonManager: Callback error: {e}")
 
+    def notify_changed(self, which: str = "all"):
+        """Save and notify after editing a preset dict from get_*() in place.
+
+        Call push_undo() before mutating so the snapshot holds the old value.
+        """
+        if self._auto_save:
+            self.save(which)
+        self._notify_change()
+
+    def begin_batch(self):
+        """Start holding back auto-saves and change notifications (nestable)."""
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """End a batch; the outermost end saves touched files and notifies once."""
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return
+
+        saves, self._batch_saves = self._batch_saves, set()
+        if "all" in saves or "both" in saves:
+            saves = {"all"}
+        for which in saves:
+            self.save(which)
+        if self._batch_changed:
+            self._batch_changed = False
+            self._notify_change()
+
+    @contextmanager
+    def batch(self):
+        """Group several mutations into one save and one change notification.
+
+        Usage:
+            with json_mgr.batch():
+                for name in names:
+                    json_mgr.duplicate_transition(name, ...)
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
     # =========================================================================
     # Utility
     # =========================================================================
 
+    def _cached_names(self, section: str, presets: Dict) -> List[str]:
+        """Preset names (excluding comments), rebuilt only when data_version moves.
+
+        The returned list is shared between calls; copy it before mutating.
+        """
+        cached = self._names_cache.get(section)
+        if cached and cached[0] == self.data_version:
+            return cached[1]
+        names = [k for k in presets if k and not k.startswith("_")]
+        self._names_cache[section] = (self.data_version, names)
+        return names
+
     def get_unique_transition_name(self, base: str = "new_preset") -> str:
         """Generate a unique transition preset name."""
-        existing = self.get_transition_names()
+        existing = self.transition_data.get("presets", {})  # dict: O(1) probes
         name = base
         counter = 1
         while name in existing:
@@ -727,7 +1110,7 @@ class JsonManager:
 
     def get_unique_shader_name(self, base: str = "new_shader") -> str:
         """Generate a unique shader preset name."""
-        existing = self.get_shader_names()
+        existing = self.shader_data.get("shader_presets", {})  # dict: O(1) probes
         name = base
         counter = 1
         while name in existing:
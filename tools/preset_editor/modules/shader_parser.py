@@ -27,9 +27,23 @@ Comment Syntax for Text Shaders:
 
 import os
 import re
+import json
+import tempfile
+import threading
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, asdict
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+
+# Parse results are cached per file, keyed by mtime/size, and persisted here
+# so that Reload and cold starts only re-parse files that actually changed
+PARSE_CACHE_PATH = Path.home() / ".preset_editor_shader_cache.json"
+PARSE_CACHE_VERSION = 1
+
+# Shader (UI thread) and text shader (loader thread) parses share the file;
+# each save is a read-modify-write, so they take turns
+_parse_cache_lock = threading.Lock()
 
 
 @dataclass
@@ -55,6 +69,113 @@ class ShaderDefinition:
     line_number: int = 0
     is_animated: bool = False
 
+    @cached_property
+    def params_by_name(self) -> Dict[str, ShaderParam]:
+        """Params keyed by name, in sorted name order (built once per definition)."""
+        return {p.name: p for p in sorted(self.params, key=lambda p: p.name)}
+
+
+# =============================================================================
+# Parse Cache
+# =============================================================================
+
+def _load_parse_cache(section: str, def_cls) -> Dict[str, tuple]:
+    """Load one section of the persisted parse cache (empty on any problem)."""
+    try:
+        with _parse_cache_lock, open(PARSE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("version") != PARSE_CACHE_VERSION:
+            return {}
+        cache = {}
+        for path, entry in data.get(section, {}).items():
+            defs = {}
+            for d in entry["defs"]:
+                d = dict(d)
+                d["params"] = [ShaderParam(**p) for p in d.get("params", [])]
+                defs[d["name"]] = def_cls(**d)
+            cache[path] = (entry["mtime"], entry["size"], defs, set(entry["register_only"]))
+        return cache
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _save_parse_cache(section: str, cache: Dict[str, tuple]):
+    """Write one section of the parse cache, keeping the other sections."""
+    section_data = {
+        path: {
+            "mtime": mtime,
+            "size": size,
+            "defs": [asdict(d) for d in defs.values()],
+            "register_only": sorted(register_only),
+        }
+        for path, (mtime, size, defs, register_only) in cache.items()
+    }
+
+    with _parse_cache_lock:
+        try:
+            with open(PARSE_CACHE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != PARSE_CACHE_VERSION:
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+
+        data["version"] = PARSE_CACHE_VERSION
+        data[section] = section_data
+
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                    'w', encoding='utf-8', dir=PARSE_CACHE_PATH.parent,
+                    prefix=PARSE_CACHE_PATH.name, suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                json.dump(data, f)
+            os.replace(tmp_path, PARSE_CACHE_PATH)
+        except OSError as e:
+            print(f"ShaderParser: Could not write parse cache: {e}")
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+def _parse_directory_cached(shader_path: Path, cache: Dict[str, tuple], read_defs, merge_defs) -> bool:
+    """Parse *.rpy files in a directory, reusing cached results for unchanged files.
+
+    Returns True if the cache was modified.
+    """
+    changed = False
+    seen = set()
+
+    for rpy_file in shader_path.glob("*.rpy"):
+        path = os.path.abspath(rpy_file)
+        seen.add(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+
+        entry = cache.get(path)
+        if entry and entry[0] == st.st_mtime and entry[1] == st.st_size:
+            merge_defs(entry[2], entry[3])
+            continue
+
+        result = read_defs(path)
+        if result is None:
+            continue
+        cache[path] = (st.st_mtime, st.st_size, result[0], result[1])
+        merge_defs(*result)
+        changed = True
+
+    # Drop entries for files removed from this directory
+    folder = os.path.abspath(shader_path)
+    for path in [p for p in cache if os.path.dirname(p) == folder and p not in seen]:
+        del cache[path]
+        changed = True
+
+    return changed
+
 
 class ShaderParser:
     """
@@ -69,6 +190,10 @@ class ShaderParser:
 
     def __init__(self):
         self.shaders: Dict[str, ShaderDefinition] = {}
+        # Absolute path -> (mtime, size, definitions, register-only names)
+        self._file_cache: Optional[Dict[str, tuple]] = None
+        # list_available_shaders() result, rebuilt after each parse
+        self._names: Optional[List[str]] = None
 
     def parse_directory(self, shader_dir: str) -> List[ShaderDefinition]:
         """
@@ -81,32 +206,57 @@ class ShaderParser:
             List of ShaderDefinition objects
         """
         self.shaders = {}
+        self._names = None
         shader_path = Path(shader_dir)
 
         if not shader_path.exists():
             print(f"ShaderParser: Directory not found: {shader_dir}")
             return []
 
-        for rpy_file in shader_path.glob("*.rpy"):
-            self._parse_file(str(rpy_file))
+        if self._file_cache is None:
+            self._file_cache = _load_parse_cache("shader", ShaderDefinition)
+
+        if _parse_directory_cached(shader_path, self._file_cache, self._read_file_defs, self._merge_defs):
+            _save_parse_cache("shader", self._file_cache)
 
         return list(self.shaders.values())
 
     def parse_file(self, filepath: str) -> List[ShaderDefinition]:
         """Parse a single .rpy file."""
         self.shaders = {}
+        self._names = None
         self._parse_file(filepath)
         return list(self.shaders.values())
 
     def _parse_file(self, filepath: str):
         """Internal method to parse a single file."""
+        result = self._read_file_defs(filepath)
+        if result:
+            self._merge_defs(*result)
+
+    def _merge_defs(self, found: Dict[str, ShaderDefinition], register_only: Set[str]):
+        """Merge one file's definitions; bare register_shader() hits never replace earlier ones."""
+        for name, shader_def in found.items():
+            if name in register_only and name in self.shaders:
+                continue
+            self.shaders[name] = shader_def
+
+    def _read_file_defs(self, filepath: str) -> Optional[Tuple[Dict[str, ShaderDefinition], Set[str]]]:
+        """Parse one file in isolation.
+
+        Returns (definitions by name, names only seen via register_shader()),
+        or None if the file could not be read.
+        """
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
                 lines = content.split('\n')
         except Exception as e:
             print(f"ShaderParser: Error reading {filepath}: {e}")
-            return
+            return None
+
+        found: Dict[str, ShaderDefinition] = {}
+        register_only: Set[str] = set()
 
         filename = os.path.basename(filepath)
 
@@ -149,7 +299,8 @@ class ShaderParser:
                 # Save previous shader if exists
                 if current_shader:
                     current_shader.params = current_params
-                    self.shaders[current_shader.name] = current_shader
+                    found[current_shader.name] = current_shader
+                    register_only.discard(current_shader.name)
 
                 shader_name = stripped.split(":", 1)[1].strip()
                 current_shader = ShaderDefinition(
@@ -179,7 +330,7 @@ class ShaderParser:
             # Also detect renpy.register_shader() calls directly
             elif 'renpy.register_shader(' in stripped:
                 shader_name = self._extract_shader_name(stripped)
-                if shader_name and shader_name not in self.shaders:
+                if shader_name and shader_name not in found:
                     # Create basic definition from register_shader call
                     shader_def = ShaderDefinition(
                         name=shader_name,
@@ -189,12 +340,16 @@ class ShaderParser:
                         source_file=filename,
                         line_number=i + 1
                     )
-                    self.shaders[shader_name] = shader_def
+                    found[shader_name] = shader_def
+                    register_only.add(shader_name)
 
         # Save last annotated shader
         if current_shader:
             current_shader.params = current_params
-            self.shaders[current_shader.name] = current_shader
+            found[current_shader.name] = current_shader
+            register_only.discard(current_shader.name)
+
+        return found, register_only
 
     def _extract_shader_name(self, line: str) -> Optional[str]:
         """Extract shader name from renpy.register_shader() call."""
@@ -292,8 +447,13 @@ class ShaderParser:
         return by_category
 
     def list_available_shaders(self) -> List[str]:
-        """Get list of all available shader names."""
-        return list(self.shaders.keys())
+        """Get list of all available shader names.
+
+        The same list object is returned until the next parse; don't mutate it.
+        """
+        if self._names is None:
+            self._names = list(self.shaders.keys())
+        return self._names
 
 
 # Convenience function
@@ -333,6 +493,21 @@ class TextShaderParser:
 
     def __init__(self):
         self.text_shaders: Dict[str, TextShaderDefinition] = {}
+        # Absolute path -> (mtime, size, definitions, register-only names)
+        self._file_cache: Optional[Dict[str, tuple]] = None
+        # list_available_text_shaders() result, rebuilt after each parse
+        self._names: Optional[List[str]] = None
+
+    def with_cache(self) -> "TextShaderParser":
+        """Return an empty parser holding a copy of this one's file cache.
+
+        The copy can parse on a worker thread while this parser keeps
+        serving the UI, then replace it once done.
+        """
+        parser = TextShaderParser()
+        if self._file_cache is not None:
+            parser._file_cache = dict(self._file_cache)
+        return parser
 
     def parse_directory(self, shader_dir: str) -> List[TextShaderDefinition]:
         """
@@ -345,32 +520,53 @@ class TextShaderParser:
             List of TextShaderDefinition objects
         """
         self.text_shaders = {}
+        self._names = None
         shader_path = Path(shader_dir)
 
         if not shader_path.exists():
             print(f"TextShaderParser: Directory not found: {shader_dir}")
             return []
 
-        for rpy_file in shader_path.glob("*.rpy"):
-            self._parse_file(str(rpy_file))
+        if self._file_cache is None:
+            self._file_cache = _load_parse_cache("textshader", TextShaderDefinition)
+
+        if _parse_directory_cached(shader_path, self._file_cache, self._read_file_defs, self._merge_defs):
+            _save_parse_cache("textshader", self._file_cache)
 
         return list(self.text_shaders.values())
 
     def parse_file(self, filepath: str) -> List[TextShaderDefinition]:
         """Parse a single .rpy file."""
         self.text_shaders = {}
+        self._names = None
         self._parse_file(filepath)
         return list(self.text_shaders.values())
 
     def _parse_file(self, filepath: str):
         """Internal method to parse a single file."""
+        result = self._read_file_defs(filepath)
+        if result:
+            self._merge_defs(*result)
+
+    def _merge_defs(self, found: Dict[str, TextShaderDefinition], register_only: Set[str]):
+        """Merge one file's definitions; bare register_textshader() hits never replace earlier ones."""
+        for name, shader_def in found.items():
+            if name in register_only and name in self.text_shaders:
+                continue
+            self.text_shaders[name] = shader_def
+
+    def _read_file_defs(self, filepath: str) -> Optional[Tuple[Dict[str, TextShaderDefinition], Set[str]]]:
+        """Parse one file in isolation (see ShaderParser._read_file_defs)."""
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
                 lines = content.split('\n')
         except Exception as e:
             print(f"TextShaderParser: Error reading {filepath}: {e}")
-            return
+            return None
+
+        found: Dict[str, TextShaderDefinition] = {}
+        register_only: Set[str] = set()
 
         filename = os.path.basename(filepath)
 
@@ -410,7 +606,8 @@ class TextShaderParser:
                 # Save previous shader if exists
                 if current_shader:
                     current_shader.params = current_params
-                    self.text_shaders[current_shader.name] = current_shader
+                    found[current_shader.name] = current_shader
+                    register_only.discard(current_shader.name)
 
                 shader_name = stripped.split(":", 1)[1].strip()
                 current_shader = TextShaderDefinition(
@@ -440,7 +637,7 @@ class TextShaderParser:
             # Also detect renpy.register_textshader() calls directly
             elif 'renpy.register_textshader(' in stripped:
                 shader_name = self._extract_textshader_name(stripped)
-                if shader_name and shader_name not in self.text_shaders:
+                if shader_name and shader_name not in found:
                     shader_def = TextShaderDefinition(
                         name=shader_name,
                         category=file_category,
@@ -449,12 +646,16 @@ class TextShaderParser:
                         source_file=filename,
                         line_number=i + 1
                     )
-                    self.text_shaders[shader_name] = shader_def
+                    found[shader_name] = shader_def
+                    register_only.add(shader_name)
 
         # Save last annotated shader
         if current_shader:
             current_shader.params = current_params
-            self.text_shaders[current_shader.name] = current_shader
+            found[current_shader.name] = current_shader
+            register_only.discard(current_shader.name)
+
+        return found, register_only
 
     def _extract_textshader_name(self, line: str) -> Optional[str]:
         """Extract text shader name from renpy.register_textshader() call."""
@@ -524,8 +725,13 @@ class TextShaderParser:
         return self.text_shaders.get(name)
 
     def list_available_text_shaders(self) -> List[str]:
-        """Get list of all available text shader names."""
-        return list(self.text_shaders.keys())
+        """Get list of all available text shader names.
+
+        The same list object is returned until the next parse; don't mutate it.
+        """
+        if self._names is None:
+            self._names = list(self.text_shaders.keys())
+        return self._names
 
 
 def parse_text_shaders(shader_dir: str) -> List[TextShaderDefinition]:
@@ -5,13 +5,18 @@ Provides consistent UI widgets for the preset editor.
 """
 
 import dearpygui.dearpygui as dpg
-from typing import Callable, List, Optional, Any, Tuple
+import queue
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any, Tuple, Iterable
 
 
 # =============================================================================
 # Color Utilities
 # =============================================================================
 
+# Parsers are cached: the same handful of colors are converted on every
+# refresh. They return tuples so cached results can't be mutated.
+@lru_cache(maxsize=512)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color (#RRGGBB) to RGB tuple (0-255)."""
     hex_color = hex_color.lstrip('#')
@@ -24,6 +29,7 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     return (255, 255, 255)
 
 
+@lru_cache(maxsize=512)
 def hex_to_rgba(hex_color: str) -> Tuple[int, int, int, int]:
     """Convert hex color (#RRGGBB or #RRGGBBAA) to RGBA tuple (0-255).
 
@@ -39,23 +45,25 @@ def hex_to_rgba(hex_color: str) -> Tuple[int, int, int, int]:
     return (255, 255, 255, 255)
 
 
+# Two-digit uppercase hex for each byte value, so formatting a color is
+# four lookups and a join instead of a format() call per channel
+_HEX_BYTES = tuple(f"{i:02X}" for i in range(256))
+
+
+def _hex_byte(value) -> str:
+    """Hex digits for one channel, clamped to 0-255."""
+    return _HEX_BYTES[int(min(255, max(0, value)))]
+
+
 def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     """Convert RGB tuple (0-255) to hex color string."""
-    return "#{:02X}{:02X}{:02X}".format(
-        int(min(255, max(0, rgb[0]))),
-        int(min(255, max(0, rgb[1]))),
-        int(min(255, max(0, rgb[2])))
-    )
+    return "#" + _hex_byte(rgb[0]) + _hex_byte(rgb[1]) + _hex_byte(rgb[2])
 
 
 def rgba_to_hex_with_alpha(rgba: Tuple[int, int, int, int]) -> str:
     """Convert RGBA tuple (0-255) to 8-digit hex color string (#RRGGBBAA)."""
-    return "#{:02X}{:02X}{:02X}{:02X}".format(
-        int(min(255, max(0, rgba[0]))),
-        int(min(255, max(0, rgba[1]))),
-        int(min(255, max(0, rgba[2]))),
-        int(min(255, max(0, rgba[3])))
-    )
+    return ("#" + _hex_byte(rgba[0]) + _hex_byte(rgba[1])
+            + _hex_byte(rgba[2]) + _hex_byte(rgba[3]))
 
 
 def rgba_to_hex(rgba: List[float], include_alpha: bool = False) -> str:
@@ -75,7 +83,7 @@ def rgba_to_hex(rgba: List[float], include_alpha: bool = False) -> str:
     a = rgba[3] if len(rgba) > 3 else 1.0
 
     # If all RGB values are <= 1.0, assume 0.0-1.0 range and scale to 0-255
-    if all(v <= 1.0 for v in [r, g, b]):
+    if r <= 1.0 and g <= 1.0 and b <= 1.0:
         r = int(r * 255)
         g = int(g * 255)
         b = int(b * 255)
@@ -108,6 +116,51 @@ def is_valid_hex(hex_str: str) -> bool:
 _color_widget_pairs: dict = {}
 
 
+def _on_color_edit_change(sender, app_data):
+    """Handle color picker change - update hex input and call user callback."""
+    pair_info = _color_widget_pairs.get(sender, {})
+    use_alpha = pair_info.get('include_alpha', False)
+    hex_color = rgba_to_hex(app_data, include_alpha=use_alpha)
+    hex_input = pair_info.get('hex_input')
+
+    # Update hex input without triggering its callback
+    if hex_input and dpg.does_item_exist(hex_input):
+        dpg.set_value(hex_input, hex_color.upper())
+
+    # Call user callback with hex string
+    user_callback = pair_info.get('callback')
+    if user_callback:
+        user_callback(sender, hex_color.upper(), pair_info.get('user_data'))
+
+
+def _on_hex_input_change(sender, app_data):
+    """Handle hex input change - update color picker and call user callback."""
+    hex_str = app_data.strip()
+
+    # Validate and normalize
+    if not hex_str.startswith('#'):
+        hex_str = f"#{hex_str}"
+
+    if not is_valid_hex(hex_str):
+        return  # Invalid hex, don't update
+
+    pair_info = _color_widget_pairs.get(sender, {})
+    color_edit = pair_info.get('color_edit')
+
+    # Update color picker (use rgba to handle both 6 and 8 digit hex)
+    if color_edit and dpg.does_item_exist(color_edit):
+        rgba = hex_to_rgba(hex_str)
+        dpg.set_value(color_edit, [rgba[0], rgba[1], rgba[2], rgba[3]])
+
+    # Normalize the hex input to uppercase
+    dpg.set_value(sender, hex_str.upper())
+
+    # Call user callback with hex string
+    user_callback = pair_info.get('callback')
+    if user_callback:
+        user_callback(sender, hex_str.upper(), pair_info.get('user_data'))
+
+
 def add_color_edit_with_hex(
     label: str,
     default_value: str,
@@ -183,56 +236,23 @@ def add_color_edit_with_hex(
         'include_alpha': include_alpha
     }
 
-    def on_color_change(sender, app_data):
-        """Handle color picker change - update hex input and call user callback."""
-        pair_info = _color_widget_pairs.get(sender, {})
-        use_alpha = pair_info.get('include_alpha', False)
-        hex_color = rgba_to_hex(app_data, include_alpha=use_alpha)
-        hex_input = pair_info.get('hex_input')
-
-        # Update hex input without triggering its callback
-        if hex_input and dpg.does_item_exist(hex_input):
-            dpg.set_value(hex_input, hex_color.upper())
-
-        # Call user callback with hex string
-        user_callback = pair_info.get('callback')
-        if user_callback:
-            user_callback(sender, hex_color.upper(), pair_info.get('user_data'))
-
-    def on_hex_change(sender, app_data):
-        """Handle hex input change - update color picker and call user callback."""
-        hex_str = app_data.strip()
-
-        # Validate and normalize
-        if not hex_str.startswith('#'):
-            hex_str = f"#{hex_str}"
-
-        if not is_valid_hex(hex_str):
-            return  # Invalid hex, don't update
-
-        pair_info = _color_widget_pairs.get(sender, {})
-        color_edit = pair_info.get('color_edit')
-
-        # Update color picker (use rgba to handle both 6 and 8 digit hex)
-        if color_edit and dpg.does_item_exist(color_edit):
-            rgba = hex_to_rgba(hex_str)
-            dpg.set_value(color_edit, [rgba[0], rgba[1], rgba[2], rgba[3]])
-
-        # Normalize the hex input to uppercase
-        dpg.set_value(sender, hex_str.upper())
-
-        # Call user callback with hex string
-        user_callback = pair_info.get('callback')
-        if user_callback:
-            user_callback(sender, hex_str.upper(), pair_info.get('user_data'))
-
     # Set callbacks
-    dpg.set_item_callback(color_edit_id, on_color_change)
-    dpg.set_item_callback(hex_input_id, on_hex_change)
+    dpg.set_item_callback(color_edit_id, _on_color_edit_change)
+    dpg.set_item_callback(hex_input_id, _on_hex_input_change)
 
     return color_edit_id, hex_input_id
 
 
+def set_color_edit_with_hex(color_edit_id: int, hex_value: str):
+    """Show a new color in a pair from add_color_edit_with_hex (no callbacks fire)."""
+    rgba = hex_to_rgba(hex_value)
+    dpg.set_value(color_edit_id, [rgba[0], rgba[1], rgba[2], rgba[3]])
+    hex_input = _color_widget_pairs.get(color_edit_id, {}).get('hex_input')
+    if hex_input and dpg.does_item_exist(hex_input):
+        hex_value = hex_value if hex_value.startswith('#') else f"#{hex_value}"
+        dpg.set_value(hex_input, hex_value.upper())
+
+
 # =============================================================================
 # Preset List Item
 # =============================================================================
@@ -276,7 +296,7 @@ class PresetListItem:
             # Checkbox
             dpg.add_checkbox(
                 default_value=self.selected,
-                callback=lambda s, a: self._on_select(self.name, a)
+                callback=self._select_clicked
             )
 
             # Color swatch (if applicable)
@@ -297,22 +317,26 @@ class PresetListItem:
             dpg.add_button(
                 label="^^",
                 width=25,
-                callback=lambda: self._on_move(self.name, "top")
+                callback=self._move_clicked,
+                user_data="top"
             )
             dpg.add_button(
                 label="^",
                 width=25,
-                callback=lambda: self._on_move(self.name, "up")
+                callback=self._move_clicked,
+                user_data="up"
             )
             dpg.add_button(
                 label="v",
                 width=25,
-                callback=lambda: self._on_move(self.name, "down")
+                callback=self._move_clicked,
+                user_data="down"
             )
             dpg.add_button(
                 label="vv",
                 width=25,
-                callback=lambda: self._on_move(self.name, "bottom")
+                callback=self._move_clicked,
+                user_data="bottom"
             )
 
             dpg.add_spacer(width=10)
@@ -321,19 +345,54 @@ class PresetListItem:
             dpg.add_button(
                 label="Edit",
                 width=40,
-                callback=lambda: self._on_edit(self.name)
+                callback=self._edit_clicked
             )
             dpg.add_button(
                 label="Dupe",
                 width=40,
-                callback=lambda: self._on_duplicate(self.name)
+                callback=self._duplicate_clicked
             )
             dpg.add_button(
                 label="Del",
                 width=35,
-                callback=lambda: self._on_delete(self.name)
+                callback=self._delete_clicked
             )
 
+    def _select_clicked(self, sender, app_data):
+        self._on_select(self.name, app_data)
+
+    def _move_clicked(self, sender, app_data, user_data):
+        self._on_move(self.name, user_data)
+
+    def _edit_clicked(self):
+        self._on_edit(self.name)
+
+    def _duplicate_clicked(self):
+        self._on_duplicate(self.name)
+
+    def _delete_clicked(self):
+        self._on_delete(self.name)
+
+
+# =============================================================================
+# Keyboard Modifiers
+# =============================================================================
+
+def is_ctrl_down() -> bool:
+    """Check whether either Ctrl key is held."""
+    return dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
+
+
+def modifier_state() -> Tuple[bool, bool]:
+    """Return (ctrl, shift) for a click handler.
+
+    Each key query crosses into DPG; the left key short-circuits the
+    right one, so an unmodified click costs two calls.
+    """
+    ctrl = is_ctrl_down()
+    shift = dpg.is_key_down(dpg.mvKey_LShift) or dpg.is_key_down(dpg.mvKey_RShift)
+    return ctrl, shift
+
 
 # =============================================================================
 # Selection Manager
@@ -342,24 +401,28 @@ class PresetListItem:
 class SelectionManager:
     """
     Manages multi-selection with Ctrl+click and Shift+click support.
+
+    The selection is a dict used as an ordered set, so membership tests
+    are O(1) while click order is kept for move top/bottom.
     """
 
     def __init__(self, items: List[str]):
         self.items = items
-        self.selected: List[str] = []
+        self.selected: Dict[str, None] = {}
         self.last_selected: Optional[str] = None
 
     def update_items(self, items: List[str]):
         """Update the list of items."""
         self.items = items
         # Remove selections that no longer exist
-        self.selected = [s for s in self.selected if s in items]
+        item_set = set(items)
+        self.selected = {s: None for s in self.selected if s in item_set}
 
-    def handle_click(self, name: str, ctrl: bool = False, shift: bool = False) -> List[str]:
+    def handle_click(self, name: str, ctrl: bool = False, shift: bool = False) -> Dict[str, None]:
         """
         Handle a click on an item.
 
-        Returns the new selection list.
+        Returns the new selection.
         """
         if shift and self.last_selected and self.last_selected in self.items:
             # Range select
@@ -368,41 +431,208 @@ class SelectionManager:
                 end_idx = self.items.index(name)
                 if start_idx > end_idx:
                     start_idx, end_idx = end_idx, start_idx
-                self.selected = self.items[start_idx:end_idx + 1]
+                self.select(self.items[start_idx:end_idx + 1])
             except ValueError:
-                self.selected = [name]
+                self.select([name])
         elif ctrl:
             # Toggle select
-            if name in self.selected:
-                self.selected.remove(name)
-            else:
-                self.selected.append(name)
+            self.toggle(name)
         else:
             # Single select
-            self.selected = [name]
+            self.select([name])
 
         self.last_selected = name
         return self.selected
 
-    def select_all(self) -> List[str]:
-        """Select all items."""
-        self.selected = self.items.copy()
+    def select(self, names: Iterable[str]) -> Dict[str, None]:
+        """Replace the selection with names, in order."""
+        self.selected = dict.fromkeys(names)
+        return self.selected
+
+    def toggle(self, name: str) -> Dict[str, None]:
+        """Add name to the selection, or remove it if already selected."""
+        if name in self.selected:
+            del self.selected[name]
+        else:
+            self.selected[name] = None
         return self.selected
 
-    def select_none(self) -> List[str]:
+    def select_all(self) -> Dict[str, None]:
+        """Select all items."""
+        return self.select(self.items)
+
+    def select_none(self) -> Dict[str, None]:
         """Clear selection."""
-        self.selected = []
+        self.selected = {}
         return self.selected
 
-    def invert_selection(self) -> List[str]:
+    def invert_selection(self) -> Dict[str, None]:
         """Invert selection."""
-        self.selected = [i for i in self.items if i not in self.selected]
-        return self.selected
+        return self.select(i for i in self.items if i not in self.selected)
 
     def is_selected(self, name: str) -> bool:
         """Check if an item is selected."""
         return name in self.selected
 
+    def single(self) -> Optional[str]:
+        """Return the selected name if exactly one is selected."""
+        if len(self.selected) != 1:
+            return None
+        return next(iter(self.selected))
+
+
+# =============================================================================
+# Virtual Selectable List
+# =============================================================================
+
+class VirtualSelectableList:
+    """
+    Selectable list that only creates rows inside the visible scroll area.
+
+    Modeled on ImGui's ListClipper: spacers above and below the built
+    window of rows keep the scrollbar sized for the whole list, and an
+    item-visible handler rebuilds the window when scrolling moves it.
+
+    Row widgets are pooled: the pool grows to the number of rows in the
+    window and its rows are reassigned to new names on scroll, so scrolling
+    and refreshing only reconfigure rows whose name or selection changed.
+    Surplus rows are hidden rather than deleted.
+
+    The container must be a child_window holding nothing but this list.
+    Row callbacks receive the item name as user_data.
+    """
+
+    ROW_HEIGHT = 17  # Selectable line height + ItemSpacing.y (default font)
+    ITEM_SPACING = 4  # Matches mvStyleVar_ItemSpacing in the dark theme
+    OVERSCAN = 4  # Extra rows built above and below the visible range
+    FALLBACK_ROWS = 30  # Rows assumed visible before the window has a size
+
+    def __init__(self, container: str, callback: Callable, width: int = -1,
+                 label_prefix: str = ""):
+        self.container = container
+        self.callback = callback
+        self.width = width
+        self.label_prefix = label_prefix
+
+        self.names: List[str] = []
+        self.selected: set = set()
+
+        self._window: Tuple[int, int] = (0, 0)
+        self._rows: List[int] = []  # Pooled row widgets, in display order
+        # Row -> (name, selected) it currently shows, or None while hidden
+        self._row_state: Dict[int, Optional[Tuple[str, bool]]] = {}
+        self._top_spacer = None
+        self._bottom_spacer = None
+        self._handler = None
+
+    def set_items(self, names: List[str], selected: Iterable[str]):
+        """Set the names and selection, then rebuild the visible rows."""
+        self.names = names
+        self.selected = set(selected)
+        self._render(self._visible_window())
+
+    def _visible_window(self) -> Tuple[int, int]:
+        """Index range [start, end) of rows to build, including overscan."""
+        count = len(self.names)
+        height = int(dpg.get_item_rect_size(self.container)[1])
+        visible = height // self.ROW_HEIGHT + 1 if height > 0 else self.FALLBACK_ROWS
+        first = int(dpg.get_y_scroll(self.container)) // self.ROW_HEIGHT
+        start = max(0, min(first, count - visible) - self.OVERSCAN)
+        end = min(count, first + visible + self.OVERSCAN)
+        return start, max(start, end)
+
+    def _on_visible(self, sender, app_data):
+        """Item-visible handler: rebuild only when the row window moved."""
+        window = self._visible_window()
+        if window != self._window:
+            self._render(window)
+
+    def _ensure_built(self):
+        """Create the spacers and scroll handler on first use."""
+        if self._top_spacer is not None and dpg.does_item_exist(self._top_spacer):
+            return
+        dpg.delete_item(self.container, children_only=True)
+        self._rows = []
+        self._row_state = {}
+        self._top_spacer = dpg.add_spacer(height=1, show=False, parent=self.container)
+        self._bottom_spacer = dpg.add_spacer(height=1, show=False, parent=self.container)
+
+        if self._handler is None:
+            with dpg.item_handler_registry() as self._handler:
+                dpg.add_item_visible_handler(callback=self._on_visible)
+        dpg.bind_item_handler_registry(self.container, self._handler)
+
+    def _set_spacer(self, spacer: int, rows: int):
+        """Size a spacer to stand in for the given number of rows."""
+        if rows > 0:
+            height = max(1, rows * self.ROW_HEIGHT - self.ITEM_SPACING)
+            dpg.configure_item(spacer, height=height, show=True)
+        else:
+            dpg.configure_item(spacer, show=False)
+
+    def _on_click(self, sender, app_data, user_data):
+        """Row callback: DPG already toggled the row, so force a resync of it."""
+        self._row_state[sender] = None
+        self.callback(sender, app_data, user_data)
+
+    def _update_row(self, row: int, name: str):
+        """Point a pooled row at a name and match its value, label and theme."""
+        is_selected = name in self.selected
+        shown = self._row_state.get(row)
+        if shown == (name, is_selected):
+            return
+        prefix = "[*] " if is_selected else "    "
+        dpg.set_value(row, is_selected)
+        dpg.configure_item(row, label=f"{prefix}{self.label_prefix}{name}",
+                           user_data=name, show=True)
+        if shown is None or shown[1] != is_selected:
+            apply_selection_theme(row, is_selected)
+        self._row_state[row] = (name, is_selected)
+
+    def _grow_pool(self, count: int):
+        """Add count hidden rows above the bottom spacer.
+
+        The rows are built in a staging container and attached in one go,
+        rather than inserted into the live list one at a time.
+        """
+        with dpg.stage() as staging:
+            for _ in range(count):
+                row = dpg.add_selectable(label="", callback=self._on_click,
+                                         width=self.width, show=False)
+                self._rows.append(row)
+                self._row_state[row] = None
+        dpg.push_container_stack(self.container)
+        dpg.unstage(staging)
+        dpg.pop_container_stack()
+        if dpg.does_item_exist(staging):
+            dpg.delete_item(staging)
+        # Unstaged rows land at the end; keep the bottom spacer below them
+        dpg.move_item(self._bottom_spacer, parent=self.container)
+
+    def _render(self, window: Tuple[int, int]):
+        """Assign names[start:end] to the pooled rows and hide the rest."""
+        if not dpg.does_item_exist(self.container):
+            return
+        self._ensure_built()
+
+        start, end = window
+        wanted = self.names[start:end]
+
+        # Grow the pool to fit the window; rows are never deleted on scroll
+        if len(self._rows) < len(wanted):
+            self._grow_pool(len(wanted) - len(self._rows))
+
+        for i, row in enumerate(self._rows):
+            if i < len(wanted):
+                self._update_row(row, wanted[i])
+            elif self._row_state[row] is not None:
+                dpg.configure_item(row, show=False)
+                self._row_state[row] = None
+
+        self._set_spacer(self._top_spacer, start)
+        self._set_spacer(self._bottom_spacer, len(self.names) - end)
+        self._window = window
+
 
 # =============================================================================
 # Popup Dialogs
@@ -543,6 +773,7 @@ class StatusBar:
         self.status_text_tag = None
         self.undo_text_tag = None
         self.redo_text_tag = None
+        self._shown = None  # (auto_save, undo_count, redo_count) on screen
 
         self._build()
 
@@ -559,7 +790,12 @@ class StatusBar:
                         color=(150, 150, 150))
 
     def update(self, auto_save: bool, undo_count: int, redo_count: int):
-        """Update status bar values."""
+        """Update status bar values (no-op when they are already shown)."""
+        values = (auto_save, undo_count, redo_count)
+        if values == self._shown:
+            return
+        self._shown = values
+
         if self.status_text_tag and dpg.does_item_exist(self.status_text_tag):
             status = "Auto-save: ON" if auto_save else "Auto-save: OFF"
             color = (100, 200, 100) if auto_save else (200, 100, 100)
@@ -574,11 +810,77 @@ class StatusBar:
 
     def set_status(self, message: str, color: tuple = (100, 200, 100)):
         """Set a custom status message."""
+        # The next update() must restore the auto-save text over this message
+        self._shown = None
         if self.status_text_tag and dpg.does_item_exist(self.status_text_tag):
             dpg.set_value(self.status_text_tag, message)
             dpg.configure_item(self.status_text_tag, color=color)
 
 
+# =============================================================================
+# Frame Scheduling
+# =============================================================================
+
+# Calls queued for the next frame, keyed so repeated requests coalesce
+_next_frame_calls: Dict[Any, Callable] = {}
+_next_frame_scheduled = False
+
+
+def call_next_frame(key: Any, func: Callable):
+    """Run func once on the next rendered frame.
+
+    Requests made with the same key before that frame collapse into one
+    call. All queued calls share a single frame callback, since DPG keeps
+    only one callback per frame number.
+
+    UI thread only; worker threads hand results back with post_to_ui().
+    """
+    global _next_frame_scheduled
+    _next_frame_calls[key] = func
+    if not _next_frame_scheduled:
+        _next_frame_scheduled = True
+        dpg.set_frame_callback(dpg.get_frame_count() + 1, _run_next_frame_calls)
+
+
+def _run_next_frame_calls():
+    """Frame callback: run everything queued by call_next_frame()."""
+    global _next_frame_scheduled
+    _next_frame_scheduled = False
+    calls = list(_next_frame_calls.values())
+    _next_frame_calls.clear()
+    for func in calls:
+        try:
+            func()
+        except Exception as e:
+            print(f"Deferred call error: {e}")
+
+
+# Calls handed over from worker threads; drained by the render loop
+_posted_calls: "queue.SimpleQueue[Callable]" = queue.SimpleQueue()
+
+
+def post_to_ui(func: Callable):
+    """Queue func to run on the UI thread. Safe to call from any thread.
+
+    The render loop runs queued calls before each frame (see
+    run_posted_calls), so nothing here touches DPG or module state.
+    """
+    _posted_calls.put(func)
+
+
+def run_posted_calls():
+    """Run every call queued by post_to_ui(). Call on the UI thread."""
+    while True:
+        try:
+            func = _posted_calls.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            func()
+        except Exception as e:
+            print(f"Posted call error: {e}")
+
+
 # =============================================================================
 # Theme Setup
 # =============================================================================
@@ -620,9 +922,9 @@ def apply_selection_theme(item_id: int, is_selected: bool):
     """Apply appropriate theme to a selectable item."""
     if SELECTED_THEME is None:
         return
-    # Only bind selected theme - unselected items use default
-    if is_selected:
-        dpg.bind_item_theme(item_id, SELECTED_THEME)
+    # Unselected items use the default theme (0 unbinds), so rows that
+    # are updated in place lose their highlight when deselected
+    dpg.bind_item_theme(item_id, SELECTED_THEME if is_selected else 0)
 
 
 def create_dark_theme() -> int:
@@ -19,6 +19,7 @@ Usage:
 import dearpygui.dearpygui as dpg
 import json
 import os
+import threading
 from pathlib import Path
 from enum import Enum
 from typing import Optional
@@ -29,7 +30,8 @@ from modules.shader_parser import ShaderParser, TextShaderParser
 from modules.demo_generator import DemoGenerator
 from modules.ui_components import (
     create_dark_theme, StatusBar, SelectionManager,
-    init_selection_themes
+    init_selection_themes, call_next_frame, post_to_ui, run_posted_calls,
+    is_ctrl_down
 )
 
 # Import tab modules
@@ -37,7 +39,7 @@ from tabs import (
     init_transition_tab, setup_transition_tab,
     refresh_transition_ui,
     init_shader_tab, setup_shader_tab,
-    refresh_shader_ui,
+    refresh_shader_ui, flush_shader_edits,
     init_textshader_tab, setup_textshader_tab,
     refresh_textshader_ui,
     init_demo_tab, setup_demo_tab,
@@ -61,6 +63,8 @@ from modals import (
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 800
 CONFIG_FILE = "config.json"
+SCRIPT_DIR = Path(__file__).resolve().parent  # Base for relative config paths
+CONFIG_PATH = SCRIPT_DIR / CONFIG_FILE
 
 
 class EditorMode(Enum):
@@ -109,13 +113,39 @@ class AppState:
         # Status bar reference
         self.status_bar: Optional[StatusBar] = None
 
+        # False until the viewport is shown; refreshes before that are skipped
+        self.ui_ready = False
+
+        # True while a worker thread reads presets (see start_data_load);
+        # reload_pending asks for another read once it finishes
+        self.loading = False
+        self.reload_pending = False
+
+        # config.json text as last read or written; save_config skips if unchanged
+        self._saved_config: Optional[str] = None
+
+        # Shader folder last parsed by ensure_shaders_loaded (None = not yet)
+        self._shaders_parsed_from: Optional[str] = None
+
+        # json_mgr.data_version the selection managers were last synced to
+        self._selection_version = -1
+
+        # Parts waiting to be refreshed on the next frame (see mark_dirty)
+        self.dirty: set = set()
+
+        # Tag of the visible top-level tab, and parts skipped while hidden
+        self.active_tab: Optional[str] = None
+        self.stale_tabs: set = set()
+
     def load_config(self):
         """Load configuration from config.json."""
-        config_path = Path(__file__).parent / CONFIG_FILE
+        config_path = CONFIG_PATH
         if config_path.exists():
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                    text = f.read()
+                config = json.loads(text)
+                self._saved_config = text
 
                 self.transition_presets_path = self._resolve_path(
                     config.get("transition_presets", "")
@@ -149,34 +179,30 @@ class AppState:
 
     def _use_defaults(self):
         """Use default paths relative to this script."""
-        base = Path(__file__).parent
-        self.transition_presets_path = str(
-            (base / "../../game/presets/transition_presets.json").resolve()
-        )
-        self.shader_presets_path = str(
-            (base / "../../game/presets/shader_presets.json").resolve()
+        self.transition_presets_path = self._resolve_path(
+            "../../game/presets/transition_presets.json"
         )
-        self.textshader_presets_path = str(
-            (base / "../../game/presets/textshader_presets.json").resolve()
+        self.shader_presets_path = self._resolve_path(
+            "../../game/presets/shader_presets.json"
         )
-        self.shader_folder = str(
-            (base / "../../game/shader").resolve()
-        )
-        self.text_shader_folder = str(
-            (base / "../../game/text_shader").resolve()
-        )
-        self.game_folder = str(
-            (base / "../../game").resolve()
+        self.textshader_presets_path = self._resolve_path(
+            "../../game/presets/textshader_presets.json"
         )
+        self.shader_folder = self._resolve_path("../../game/shader")
+        self.text_shader_folder = self._resolve_path("../../game/text_shader")
+        self.game_folder = self._resolve_path("../../game")
 
     def _resolve_path(self, path: str) -> str:
-        """Resolve a path relative to this script."""
+        """Resolve a path relative to this script.
+
+        Uses normpath rather than Path.resolve() - symlinks don't need
+        following here, and it avoids a filesystem hit per call.
+        """
         if not path:
             return ""
-        p = Path(path)
-        if not p.is_absolute():
-            p = Path(__file__).parent / path
-        return str(p.resolve())
+        if os.path.isabs(path):
+            return os.path.normpath(path)
+        return os.path.normpath(os.path.join(SCRIPT_DIR, path))
 
     def save_config(self):
         """Save configuration to config.json."""
@@ -191,42 +217,95 @@ class AppState:
             "demo_width": self.demo_width,
             "demo_height": self.demo_height
         }
-        config_path = Path(__file__).parent / CONFIG_FILE
+        config_path = CONFIG_PATH
+        text = json.dumps(config, indent=4)
+        if text == self._saved_config:
+            return True
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4)
+            tmp_path = config_path.with_suffix(".json.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_path)
+            self._saved_config = text
             print(f"Config saved to: {config_path}")
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
             return False
 
+    def sync_selections(self):
+        """Update selection managers, but only if preset names have changed."""
+        version = self.json_mgr.data_version
+        if version == self._selection_version:
+            return
+        self.trans_selection.update_items(self.json_mgr.get_transition_names())
+        self.shader_selection.update_items(self.json_mgr.get_shader_names())
+        self.textshader_selection.update_items(self.json_mgr.get_textshader_names())
+        self._selection_version = version
+
     def load_data(self):
-        """Load all data (JSON presets and shader definitions)."""
-        self.json_mgr.set_paths(
+        """Load JSON presets and text shader definitions."""
+        self.apply_data(self.data_reader()())
+
+    def data_reader(self):
+        """Return a function that reads the configured presets.
+
+        Call on the UI thread. The returned function reads the preset files
+        and parses the text shader folder without touching shared state, so
+        it can run on a worker thread; hand its result to apply_data().
+        """
+        paths = (
             self.transition_presets_path,
             self.shader_presets_path,
             self.textshader_presets_path
         )
-        self.json_mgr.load()
+        read_json = self.json_mgr.reader(*paths)
+        text_shader_folder = self.text_shader_folder
+        parser = self.text_shader_parser.with_cache()
+
+        def read():
+            json_files = read_json()
+            if text_shader_folder and Path(text_shader_folder).exists():
+                parser.parse_directory(text_shader_folder)
+                return paths, json_files, parser
+            return paths, json_files, None
+
+        return read
+
+    def apply_data(self, loaded):
+        """Install what a data_reader() function read. UI thread only."""
+        paths, json_files, parser = loaded
+
+        # Text shader .rpy files were parsed by the reader; swap them in
+        # before json_mgr.load() notifies the tabs
+        if parser is not None:
+            self.text_shader_parser = parser
+
+        # Switch paths only now, so saves made while the files were read
+        # went to the files the in-memory data came from
+        self.json_mgr.set_paths(*paths)
+        self.json_mgr.load(json_files)
 
         # Update selection managers
-        self.trans_selection.update_items(self.json_mgr.get_transition_names())
-        self.shader_selection.update_items(self.json_mgr.get_shader_names())
-        self.textshader_selection.update_items(self.json_mgr.get_textshader_names())
+        self.sync_selections()
 
         # Set presets path for demo generator (for text shader lookup)
         if self.textshader_presets_path:
             presets_folder = str(Path(self.textshader_presets_path).parent)
             self.demo_gen.set_presets_path(presets_folder)
 
-        # Parse shader .rpy files
+        # Shader .rpy files are parsed when the shader tab first needs them
+        self._shaders_parsed_from = None
+
+    def ensure_shaders_loaded(self):
+        """Parse the shader .rpy folder on first use after a (re)load."""
+        if self._shaders_parsed_from == self.shader_folder:
+            return
         if self.shader_folder and Path(self.shader_folder).exists():
             self.shader_parser.parse_directory(self.shader_folder)
-
-        # Parse text shader .rpy files
-        if self.text_shader_folder and Path(self.text_shader_folder).exists():
-            self.text_shader_parser.parse_directory(self.text_shader_folder)
+        self._shaders_parsed_from = self.shader_folder
 
 
 # Global state
@@ -237,22 +316,79 @@ app = AppState()
 # UI Refresh Functions
 # =============================================================================
 
+# Refresh part -> (top-level tab tag, refresher) for tabs that mirror preset data
+TAB_REFRESHERS = {
+    "transition": ("trans_tab", refresh_transition_ui),
+    "shader": ("shader_tab", refresh_shader_ui),
+    "textshader": ("textshader_tab", refresh_textshader_ui),
+    "demo": ("demo_tab", refresh_demo_tab),
+}
+
+
+def refresh_tab(part: str):
+    """Refresh a tab now if it is showing, otherwise when it is next opened."""
+    tag, refresh = TAB_REFRESHERS[part]
+    if app.active_tab is not None and tag != app.active_tab:
+        app.stale_tabs.add(part)
+        return
+    app.stale_tabs.discard(part)
+    refresh()
+
+
+def _on_tab_changed(sender, app_data):
+    """Tab bar callback: catch up a tab that went stale while hidden."""
+    app.active_tab = dpg.get_item_alias(app_data) or app_data
+    for part, (tag, _) in TAB_REFRESHERS.items():
+        if tag == app.active_tab and part in app.stale_tabs:
+            refresh_tab(part)
+
+
 def refresh_all():
-    """Refresh all UI elements."""
-    app.trans_selection.update_items(app.json_mgr.get_transition_names())
-    app.shader_selection.update_items(app.json_mgr.get_shader_names())
-    app.textshader_selection.update_items(app.json_mgr.get_textshader_names())
-
-    refresh_transition_ui()
-    refresh_shader_ui()
-    refresh_textshader_ui()
-    refresh_demo_tab()
+    """Refresh all UI elements (hidden tabs are refreshed when next opened)."""
+    if not app.ui_ready:
+        return
+
+    app.sync_selections()
+
+    for part in TAB_REFRESHERS:
+        refresh_tab(part)
     update_status_bar()
 
 
+def mark_dirty(*parts: str):
+    """Request a refresh of the given parts on the next frame.
+
+    Parts: "transition", "shader", "textshader", "demo", "status", or
+    "all" (the default). Requests made during one frame are merged, so
+    bulk operations end up in a single flush.
+    """
+    app.dirty.update(parts or ("all",))
+    call_next_frame("flush_dirty", flush_dirty)
+
+
+def flush_dirty():
+    """Run the refreshers for everything marked dirty since the last frame."""
+    parts, app.dirty = app.dirty, set()
+    if "all" in parts:
+        refresh_all()
+        return
+
+    app.sync_selections()
+    for part in TAB_REFRESHERS:
+        if part in parts:
+            refresh_tab(part)
+    if "status" in parts:
+        update_status_bar()
+
+
+def _on_data_change():
+    """JsonManager change listener: coalesce status bar updates per frame."""
+    mark_dirty("status")
+
+
 def update_status_bar():
     """Update the status bar."""
-    if app.status_bar:
+    if app.ui_ready and app.status_bar:
         app.status_bar.update(
             auto_save=True,
             undo_count=app.json_mgr.undo_count,
@@ -260,6 +396,20 @@ def update_status_bar():
         )
 
 
+def undo_edit():
+    """Undo the last edit, including a param edit still being buffered."""
+    flush_shader_edits()
+    app.json_mgr.undo()
+    mark_dirty()
+
+
+def redo_edit():
+    """Redo the last undone edit."""
+    flush_shader_edits()
+    app.json_mgr.redo()
+    mark_dirty()
+
+
 # =============================================================================
 # Main UI Setup
 # =============================================================================
@@ -270,16 +420,16 @@ def setup_ui():
     # Menu bar
     with dpg.viewport_menu_bar():
         with dpg.menu(label="File"):
-            dpg.add_menu_item(label="Reload", callback=lambda: (app.load_data(), refresh_all()))
+            dpg.add_menu_item(label="Reload", callback=reload_data)
             dpg.add_menu_item(label="Settings", callback=show_settings_modal)
             dpg.add_menu_item(label="Output", callback=show_output_window)
             dpg.add_separator()
             dpg.add_menu_item(label="Exit", callback=dpg.stop_dearpygui)
 
         with dpg.menu(label="Edit"):
-            dpg.add_menu_item(label="Undo", callback=lambda: (app.json_mgr.undo(), refresh_all()),
+            dpg.add_menu_item(label="Undo", callback=undo_edit,
                             shortcut="Ctrl+Z")
-            dpg.add_menu_item(label="Redo", callback=lambda: (app.json_mgr.redo(), refresh_all()),
+            dpg.add_menu_item(label="Redo", callback=redo_edit,
                             shortcut="Ctrl+Y")
 
     # Main window
@@ -288,13 +438,14 @@ def setup_ui():
         dpg.add_spacer(height=10)
 
         # Tab bar - each tab is built by its module
-        with dpg.tab_bar() as tab_bar:
+        with dpg.tab_bar(callback=_on_tab_changed) as tab_bar:
             setup_transition_tab(tab_bar)
             setup_shader_tab(tab_bar)
             setup_textshader_tab(tab_bar)
             setup_demo_tab(tab_bar)
             setup_gameconfig_tab(tab_bar)
             setup_dialogbox_tab(tab_bar)
+        app.active_tab = "trans_tab"  # The first tab is shown on startup
 
         # Status bar at bottom
         dpg.add_separator()
@@ -306,24 +457,72 @@ def setup_ui():
 
 def setup_keyboard_shortcuts():
     """Set up global keyboard shortcuts."""
-    def ctrl_pressed():
-        return dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
-
     def undo_callback():
-        if ctrl_pressed():
-            app.json_mgr.undo()
-            refresh_all()
+        if is_ctrl_down():
+            undo_edit()
 
     def redo_callback():
-        if ctrl_pressed():
-            app.json_mgr.redo()
-            refresh_all()
+        if is_ctrl_down():
+            redo_edit()
 
     with dpg.handler_registry():
         dpg.add_key_press_handler(dpg.mvKey_Z, callback=undo_callback)
         dpg.add_key_press_handler(dpg.mvKey_Y, callback=redo_callback)
 
 
+# =============================================================================
+# Startup Loading
+# =============================================================================
+
+def load_data_async(read):
+    """Worker thread: run a data_reader() function, hand the result to the UI."""
+    loaded = None
+    try:
+        loaded = read()
+    except Exception as e:
+        print(f"Error loading data: {e}")
+    finally:
+        # Everything past the file reads happens on the UI thread
+        post_to_ui(lambda: _on_data_loaded(loaded))
+
+
+def _on_data_loaded(loaded):
+    """UI thread: install the loaded data, enable and run UI refreshes."""
+    try:
+        if loaded is not None:
+            # Save buffered param edits to the files they were made against
+            flush_shader_edits()
+            app.apply_data(loaded)
+    finally:
+        app.loading = False
+        app.ui_ready = True
+        # A reload asked for mid-load may need paths or files this read missed
+        if app.reload_pending:
+            app.reload_pending = False
+            reload_data()
+    refresh_all()
+
+
+def start_data_load():
+    """Read presets on a worker thread; see load_data_async."""
+    read = app.data_reader()
+    app.loading = True
+    threading.Thread(target=load_data_async, args=(read,), daemon=True).start()
+
+
+def reload_data():
+    """Re-read presets on a worker thread; the data is swapped in when done."""
+    if app.loading:
+        # Run it after the current read rather than dropping it
+        app.reload_pending = True
+        if app.status_bar:
+            app.status_bar.set_status("Reload queued until loading finishes...", (200, 200, 100))
+        return
+    if app.status_bar:
+        app.status_bar.set_status("Reloading presets...", (200, 200, 100))
+    start_data_load()
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -346,24 +545,22 @@ def main():
     init_transition_tab(app, EditorMode, update_status_bar)
     init_shader_tab(app, EditorMode, update_status_bar)
     init_textshader_tab(app, EditorMode, update_status_bar)
-    init_demo_tab(app, refresh_all)
-    init_gameconfig_tab(app, refresh_all)
-    init_dialogbox_tab(app, refresh_all)
+    init_demo_tab(app, mark_dirty)
+    init_gameconfig_tab(app, mark_dirty)
+    init_dialogbox_tab(app, mark_dirty)
 
     # Initialize modal modules
-    init_settings_modal(app, refresh_all)
+    init_settings_modal(app, reload_data)
 
     # Build UI
     setup_ui()
     setup_keyboard_shortcuts()
 
-    # Load data
-    app.load_data()
-
     # Register change callback
-    app.json_mgr.on_change(update_status_bar)
+    app.json_mgr.on_change(_on_data_change)
 
-    # Create viewport
+    # Create and show the viewport before loading data so the window
+    # appears immediately; presets and shaders load on a worker thread
     dpg.create_viewport(
         title="Preset Editor v2.0",
         width=WINDOW_WIDTH,
@@ -372,11 +569,14 @@ def main():
     dpg.setup_dearpygui()
     dpg.show_viewport()
 
-    # Initial refresh
-    refresh_all()
+    if app.status_bar:
+        app.status_bar.set_status("Loading presets...", (200, 200, 100))
+    start_data_load()
 
-    # Run
-    dpg.start_dearpygui()
+    # Run; the loop also runs calls posted by worker threads
+    while dpg.is_dearpygui_running():
+        run_posted_calls()
+        dpg.render_dearpygui_frame()
     dpg.destroy_context()
 
 
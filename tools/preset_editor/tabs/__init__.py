@@ -24,6 +24,7 @@ from .shader_tab import (
     refresh_shader_json,
     switch_shader_mode,
     add_new_shader,
+    flush_shader_edits,
 )
 
 from .textshader_tab import (
@@ -75,6 +76,7 @@ __all__ = [
     'refresh_shader_json',
     'switch_shader_mode',
     'add_new_shader',
+    'flush_shader_edits',
     # Text Shader
     'init_textshader_tab',
     'setup_textshader_tab',
@@ -14,14 +14,30 @@ Three testing modes (mutually exclusive checkboxes):
 
 import dearpygui.dearpygui as dpg
 import subprocess
+import threading
 import os
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from modules.ui_components import apply_selection_theme
+from modules.ui_components import (
+    apply_selection_theme, is_ctrl_down, VirtualSelectableList, post_to_ui
+)
 from modules.demo_generator import DemoItem
 
 
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Popen options that detach Ren'Py from the editor, so it keeps running on
+# its own and isn't tied to our console or process group
+if sys.platform == "win32":
+    _DETACHED = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _DETACHED = {"start_new_session": True}
+
+
 # =============================================================================
 # Module State (set by init_demo_tab)
 # =============================================================================
@@ -30,10 +46,23 @@ _app = None  # Reference to AppState
 _refresh_all = None  # Callback to refresh all UI
 _initialized = False  # Track if already initialized
 
-# Local selection state for the three columns
-_trans_selected: List[str] = []
-_shader_selected: List[str] = []
-_textshader_selected: List[str] = []
+# Demo item rows: (group, number text, name text, remove button, separator).
+# Built once and reused; rows beyond the item count are hidden.
+_item_slots: List[tuple] = []
+_slot_shown: List[tuple] = []  # Per slot: (item or None while hidden, separator shown)
+_items_placeholder = None
+
+_trans_list = None  # VirtualSelectableList for the transitions column
+_shader_list = None  # VirtualSelectableList for the shaders column
+_textshader_shown = None  # (names, selection, enabled) the text shader column shows
+_textshader_rows: Dict[str, int] = {}  # name -> selectable while the column is interactive
+_launching = False  # A Create Demo launch is running on its worker thread
+
+# Local selection state for the three columns. Dicts used as ordered sets:
+# O(1) membership, and the first key is the earliest pick (see _add_selected)
+_trans_selected: Dict[str, None] = {}
+_shader_selected: Dict[str, None] = {}
+_textshader_selected: Dict[str, None] = {}
 
 
 def init_demo_tab(app_state, refresh_callback):
@@ -50,10 +79,14 @@ def init_demo_tab(app_state, refresh_callback):
 
 
 def _on_data_change():
-    """Callback when JSON data changes - refresh demo preset lists."""
-    _refresh_trans_list()
-    _refresh_shader_list()
-    _refresh_textshader_list()
+    """Callback when JSON data changes - refresh demo preset lists.
+
+    Goes through the app's deferred refresh, so a burst of changes costs one
+    rebuild on the next frame (or none until the tab is next opened).
+    """
+    if not _app.ui_ready:
+        return
+    _refresh_all("demo")
 
 
 # =============================================================================
@@ -61,8 +94,14 @@ def _on_data_change():
 # =============================================================================
 
 def setup_demo_tab(parent):
+    """Add the Demo tab; its contents are built the first time it is shown."""
+    dpg.add_tab(label="DEMO", parent=parent, tag="demo_tab")
+
+
+def _build_demo_tab():
     """Build the Demo tab UI structure."""
-    with dpg.tab(label="DEMO", parent=parent):
+    global _trans_list, _shader_list
+    with dpg.group(parent="demo_tab"):
         # Top toolbar
         with dpg.group():
             # Demo size row
@@ -177,13 +216,24 @@ def setup_demo_tab(parent):
                         width=95
                     )
 
+    _trans_list = VirtualSelectableList("demo_trans_list", _on_trans_select, width=230)
+    _shader_list = VirtualSelectableList("demo_shader_list", _on_shader_select, width=230)
+
 
 # =============================================================================
 # Refresh Functions
 # =============================================================================
 
 def refresh_demo_tab():
-    """Refresh all demo tab content."""
+    """Refresh all demo tab content.
+
+    Only runs while the tab is shown (see refresh_tab), so the first call
+    is also where the tab's widgets get built.
+    """
+    if not _app.ui_ready:
+        return
+    if _trans_list is None:
+        _build_demo_tab()
     _refresh_trans_list()
     _refresh_shader_list()
     _refresh_textshader_list()
@@ -206,79 +256,70 @@ def _sync_ui_from_app():
 
 
 def _refresh_trans_list():
-    """Refresh the transitions column."""
-    global _trans_selected
-
-    if not dpg.does_item_exist("demo_trans_list"):
+    """Refresh the transitions column (only rows whose state changed are touched)."""
+    if _trans_list is None:
         return
-
-    dpg.delete_item("demo_trans_list", children_only=True)
-
-    names = _app.json_mgr.get_transition_names()
-
-    for name in names:
-        is_selected = name in _trans_selected
-        prefix = "[*] " if is_selected else "    "
-        item_id = dpg.add_selectable(
-            label=f"{prefix}{name}",
-            default_value=is_selected,
-            callback=_on_trans_select,
-            user_data=name,
-            width=230,
-            parent="demo_trans_list"
-        )
-        apply_selection_theme(item_id, is_selected)
+    _trans_list.set_items(_app.json_mgr.get_transition_names(), _trans_selected)
 
 
 def _refresh_shader_list():
-    """Refresh the shaders column."""
-    global _shader_selected
-
-    if not dpg.does_item_exist("demo_shader_list"):
+    """Refresh the shaders column (only rows whose state changed are touched)."""
+    if _shader_list is None:
         return
-
-    dpg.delete_item("demo_shader_list", children_only=True)
-
-    names = _app.json_mgr.get_shader_names()
-
-    for name in names:
-        is_selected = name in _shader_selected
-        prefix = "[*] " if is_selected else "    "
-        item_id = dpg.add_selectable(
-            label=f"{prefix}{name}",
-            default_value=is_selected,
-            callback=_on_shader_select,
-            user_data=name,
-            width=230,
-            parent="demo_shader_list"
-        )
-        apply_selection_theme(item_id, is_selected)
+    _shader_list.set_items(_app.json_mgr.get_shader_names(), _shader_selected)
 
 
 def _refresh_textshader_list():
-    """Refresh the text shaders column."""
-    global _textshader_selected
+    """Refresh the text shaders column.
+
+    Nothing is done when the column is already current, and a selection
+    change only updates the rows that flipped; the rows are rebuilt only
+    when the names or the enabled state change.
+    """
+    global _textshader_shown
 
     if not dpg.does_item_exist("demo_textshader_list"):
         return
 
-    dpg.delete_item("demo_textshader_list", children_only=True)
-
     # Text shaders are enabled when EITHER checkbox is checked
     # Both modes support text shaders on dialogue text
     text_shaders_enabled = _app.demo_gen.apply_to_text or _app.demo_gen.apply_to_dialog
+    names = _app.json_mgr.get_textshader_names()
+
+    shown = (names, tuple(_textshader_selected), text_shaders_enabled)
+    if shown == _textshader_shown:
+        return
+    previous, _textshader_shown = _textshader_shown, shown
+
+    if previous is not None and previous[0] == names and previous[2] == text_shaders_enabled:
+        if text_shaders_enabled:
+            for name in set(previous[1]).symmetric_difference(_textshader_selected):
+                row = _textshader_rows.get(name)
+                if row is not None:
+                    _set_textshader_row(row, name, name in _textshader_selected)
+        return
+
+    dpg.delete_item("demo_textshader_list", children_only=True)
+    _textshader_rows.clear()
+
+    # Build the rows off-screen and attach them in one go
+    with dpg.stage() as staging:
+        _build_textshader_rows(names, text_shaders_enabled)
+    dpg.push_container_stack("demo_textshader_list")
+    dpg.unstage(staging)
+    dpg.pop_container_stack()
+    if dpg.does_item_exist(staging):
+        dpg.delete_item(staging)
 
+
+def _build_textshader_rows(names: List[str], text_shaders_enabled: bool):
+    """Create the text shader column's widgets in the current container."""
     if not text_shaders_enabled:
         # Show disabled message when in character mode
-        dpg.add_text("(Enable 'Apply to text'", parent="demo_textshader_list",
-                    color=(128, 128, 128))
-        dpg.add_text(" or 'Apply to dialog'", parent="demo_textshader_list",
-                    color=(128, 128, 128))
-        dpg.add_text(" to use text shaders)", parent="demo_textshader_list",
-                    color=(128, 128, 128))
-        dpg.add_separator(parent="demo_textshader_list")
-
-    names = _app.json_mgr.get_textshader_names()
+        dpg.add_text("(Enable 'Apply to text'", color=(128, 128, 128))
+        dpg.add_text(" or 'Apply to dialog'", color=(128, 128, 128))
+        dpg.add_text(" to use text shaders)", color=(128, 128, 128))
+        dpg.add_separator()
 
     for name in names:
         is_selected = name in _textshader_selected
@@ -291,113 +332,120 @@ def _refresh_textshader_list():
                 default_value=is_selected,
                 callback=_on_textshader_select,
                 user_data=name,
-                width=230,
-                parent="demo_textshader_list"
+                width=230
             )
-            apply_selection_theme(item_id, is_selected)
+            if is_selected:
+                apply_selection_theme(item_id, True)
+            _textshader_rows[name] = item_id
         else:
             # Grayed out display-only mode
-            dpg.add_text(
-                f"    {name}",
-                parent="demo_textshader_list",
-                color=(100, 100, 100)
-            )
+            dpg.add_text(f"    {name}", color=(100, 100, 100))
+
+
+def _set_textshader_row(row: int, name: str, is_selected: bool):
+    """Match one text shader row's value, label and theme to its selection."""
+    prefix = "[*] " if is_selected else "    "
+    dpg.set_value(row, is_selected)
+    dpg.configure_item(row, label=f"{prefix}{name}")
+    apply_selection_theme(row, is_selected)
 
 
 def _refresh_demo_items():
-    """Refresh the demo items column."""
+    """Refresh the demo items column, reusing its row widgets."""
+    global _items_placeholder
     if not dpg.does_item_exist("demo_items_list"):
         return
 
-    dpg.delete_item("demo_items_list", children_only=True)
-
     items = _app.demo_gen.items
-
-    if not items:
-        dpg.add_text("No demo items yet.", parent="demo_items_list")
-        dpg.add_text("Select presets from the", parent="demo_items_list")
-        dpg.add_text("columns and click 'Add Selected'", parent="demo_items_list")
-        return
-
-    for i, item in enumerate(items):
-        with dpg.group(horizontal=True, parent="demo_items_list"):
-            dpg.add_text(f"{i+1}.")
-            dpg.add_text(item.display_name, wrap=250)
-            dpg.add_button(
-                label="X",
-                callback=_remove_demo_item,
-                user_data=i,
-                width=20
-            )
-
-        if i < len(items) - 1:
-            dpg.add_separator(parent="demo_items_list")
+    count = len(items)
+
+    if _items_placeholder is None or not dpg.does_item_exist(_items_placeholder):
+        dpg.delete_item("demo_items_list", children_only=True)
+        _item_slots.clear()
+        _slot_shown.clear()
+        with dpg.group(parent="demo_items_list") as _items_placeholder:
+            dpg.add_text("No demo items yet.")
+            dpg.add_text("Select presets from the")
+            dpg.add_text("columns and click 'Add Selected'")
+
+    missing = max(count, _app.demo_gen.MAX_ITEMS) - len(_item_slots)
+    if missing > 0:
+        # Build the new rows off-screen and attach them in one go
+        with dpg.stage() as staging:
+            for _ in range(missing):
+                with dpg.group(horizontal=True, show=False) as group:
+                    number = dpg.add_text("")
+                    label = dpg.add_text("", wrap=250)
+                    button = dpg.add_button(label="X", callback=_remove_demo_item, width=20)
+                separator = dpg.add_separator(show=False)
+                _item_slots.append((group, number, label, button, separator))
+                _slot_shown.append((None, False))
+        dpg.push_container_stack("demo_items_list")
+        dpg.unstage(staging)
+        dpg.pop_container_stack()
+        if dpg.does_item_exist(staging):
+            dpg.delete_item(staging)
+
+    dpg.configure_item(_items_placeholder, show=not count)
+
+    # Only slots whose item or separator changed are touched. Items are
+    # compared by identity: equal-looking items are still different rows.
+    for i, (group, number, label, button, separator) in enumerate(_item_slots):
+        item = items[i] if i < count else None
+        has_separator = i < count - 1
+        shown_item, shown_separator = _slot_shown[i]
+        if item is shown_item and has_separator == shown_separator:
+            continue
+        if item is not None:
+            dpg.set_value(number, f"{i+1}.")
+            dpg.set_value(label, item.display_name)
+            # The item itself identifies the row, so removal can't hit a shifted index
+            dpg.configure_item(button, user_data=item)
+            dpg.configure_item(group, show=True)
+            dpg.configure_item(separator, show=has_separator)
+        else:
+            dpg.configure_item(group, show=False)
+            dpg.configure_item(separator, show=False)
+        _slot_shown[i] = (item, has_separator)
 
 
 # =============================================================================
 # Selection Callbacks
 # =============================================================================
 
-def _on_trans_select(sender, app_data, user_data):
-    """Handle transition selection."""
-    global _trans_selected
-    name = user_data
-
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
+def _clicked(selected: Dict[str, None], name: str) -> Dict[str, None]:
+    """Selection after clicking name.
 
-    if ctrl:
-        if name in _trans_selected:
-            _trans_selected.remove(name)
-        else:
-            _trans_selected.append(name)
-    else:
-        if name in _trans_selected:
-            _trans_selected = []
+    Ctrl toggles it; a plain click selects only it, or clears the column
+    if it was already selected.
+    """
+    if is_ctrl_down():
+        if name in selected:
+            del selected[name]
         else:
-            _trans_selected = [name]
+            selected[name] = None
+        return selected
+    return {} if name in selected else {name: None}
 
+
+def _on_trans_select(sender, app_data, user_data):
+    """Handle transition selection."""
+    global _trans_selected
+    _trans_selected = _clicked(_trans_selected, user_data)
     _refresh_trans_list()
 
 
 def _on_shader_select(sender, app_data, user_data):
     """Handle shader selection."""
     global _shader_selected
-    name = user_data
-
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
-
-    if ctrl:
-        if name in _shader_selected:
-            _shader_selected.remove(name)
-        else:
-            _shader_selected.append(name)
-    else:
-        if name in _shader_selected:
-            _shader_selected = []
-        else:
-            _shader_selected = [name]
-
+    _shader_selected = _clicked(_shader_selected, user_data)
     _refresh_shader_list()
 
 
 def _on_textshader_select(sender, app_data, user_data):
     """Handle text shader selection."""
     global _textshader_selected
-    name = user_data
-
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
-
-    if ctrl:
-        if name in _textshader_selected:
-            _textshader_selected.remove(name)
-        else:
-            _textshader_selected.append(name)
-    else:
-        if name in _textshader_selected:
-            _textshader_selected = []
-        else:
-            _textshader_selected = [name]
-
+    _textshader_selected = _clicked(_textshader_selected, user_data)
     _refresh_textshader_list()
 
 
@@ -410,8 +458,8 @@ def _add_selected(sender=None, app_data=None, user_data=None):
     global _trans_selected, _shader_selected, _textshader_selected
 
     # Get first selected from each column (or None)
-    trans = _trans_selected[0] if _trans_selected else None
-    shader = _shader_selected[0] if _shader_selected else None
+    trans = next(iter(_trans_selected), None)
+    shader = next(iter(_shader_selected), None)
 
     # Determine target based on checkbox state
     # "apply to dialog" checked → dialog target (uses dialog artwork)
@@ -426,7 +474,7 @@ def _add_selected(sender=None, app_data=None, user_data=None):
     text_shaders_enabled = _app.demo_gen.apply_to_text or _app.demo_gen.apply_to_dialog
     textshader = None
     if text_shaders_enabled and _textshader_selected:
-        textshader = _textshader_selected[0]
+        textshader = next(iter(_textshader_selected))
 
     if not trans and not shader and not textshader:
         if _app.status_bar:
@@ -445,12 +493,19 @@ def _add_selected(sender=None, app_data=None, user_data=None):
     )
 
     if success:
-        # Clear selections after adding
-        _trans_selected = []
-        _shader_selected = []
-        _textshader_selected = []
-
-        refresh_demo_tab()
+        # Clear selections after adding; only columns that had one need redrawing
+        stale = [refresh for selected, refresh in (
+            (_trans_selected, _refresh_trans_list),
+            (_shader_selected, _refresh_shader_list),
+            (_textshader_selected, _refresh_textshader_list),
+        ) if selected]
+        _trans_selected = {}
+        _shader_selected = {}
+        _textshader_selected = {}
+
+        for refresh in stale:
+            refresh()
+        _refresh_demo_items()
 
         if _app.status_bar:
             _app.status_bar.set_status("Demo item added", (100, 200, 100))
@@ -463,9 +518,11 @@ def _add_selected(sender=None, app_data=None, user_data=None):
 
 
 def _remove_demo_item(sender, app_data, user_data):
-    """Remove a demo item by index."""
-    index = user_data
-    _app.demo_gen.remove_item(index)
+    """Remove the demo item shown in the clicked row."""
+    for index, item in enumerate(_app.demo_gen.items):
+        if item is user_data:
+            _app.demo_gen.remove_item(index)
+            break
     _refresh_demo_items()
 
 
@@ -485,47 +542,46 @@ def _export_code(sender=None, app_data=None, user_data=None):
             _app.status_bar.set_status("No demo items to export", (255, 200, 100))
         return
 
-    # Create file dialog for save
-    def _on_file_selected(sender, app_data):
-        """Handle file selection from save dialog."""
-        if not app_data or "file_path_name" not in app_data:
-            return
+    # The save dialog is built on first use and reused afterwards
+    if not dpg.does_item_exist("export_file_dialog"):
+        with dpg.file_dialog(
+            tag="export_file_dialog",
+            directory_selector=False,
+            show=False,
+            callback=_on_export_file_selected,
+            default_filename="preset_export.txt",
+            width=600,
+            height=400
+        ):
+            dpg.add_file_extension(".txt", color=(0, 255, 0, 255))
+            dpg.add_file_extension(".*", color=(150, 150, 150, 255))
+    dpg.show_item("export_file_dialog")
+
+
+def _on_export_file_selected(sender, app_data):
+    """Handle file selection from the export save dialog."""
+    if not app_data or "file_path_name" not in app_data:
+        return
 
-        file_path = app_data["file_path_name"]
+    file_path = app_data["file_path_name"]
 
-        # Ensure .txt extension
-        if not file_path.lower().endswith(".txt"):
-            file_path += ".txt"
+    # Ensure .txt extension
+    if not file_path.lower().endswith(".txt"):
+        file_path += ".txt"
 
-        # Generate the code
-        code = _generate_export_code()
+    # Generate the code
+    code = _generate_export_code()
 
-        # Write to file
-        try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(code)
+    # Write to file
+    try:
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(code)
 
-            if _app.status_bar:
-                _app.status_bar.set_status(f"Code exported to: {file_path}", (100, 200, 100))
-        except Exception as e:
-            if _app.status_bar:
-                _app.status_bar.set_status(f"Export failed: {e}", (255, 100, 100))
-
-    # Create and show file dialog
-    if dpg.does_item_exist("export_file_dialog"):
-        dpg.delete_item("export_file_dialog")
-
-    with dpg.file_dialog(
-        tag="export_file_dialog",
-        directory_selector=False,
-        show=True,
-        callback=_on_file_selected,
-        default_filename="preset_export.txt",
-        width=600,
-        height=400
-    ):
-        dpg.add_file_extension(".txt", color=(0, 255, 0, 255))
-        dpg.add_file_extension(".*", color=(150, 150, 150, 255))
+        if _app.status_bar:
+            _app.status_bar.set_status(f"Code exported to: {file_path}", (100, 200, 100))
+    except Exception as e:
+        if _app.status_bar:
+            _app.status_bar.set_status(f"Export failed: {e}", (255, 100, 100))
 
 
 def _generate_export_code() -> str:
@@ -647,7 +703,7 @@ def _on_apply_to_text_change(sender, app_data, user_data=None):
 
     # Clear text shader selection when both are off
     if not _app.demo_gen.apply_to_text and not _app.demo_gen.apply_to_dialog:
-        _textshader_selected = []
+        _textshader_selected = {}
 
     # Refresh text shader list to show enabled/disabled state
     _refresh_textshader_list()
@@ -670,7 +726,7 @@ def _on_apply_to_dialog_change(sender, app_data, user_data=None):
 
     # Clear text shader selection when both are off
     if not _app.demo_gen.apply_to_text and not _app.demo_gen.apply_to_dialog:
-        _textshader_selected = []
+        _textshader_selected = {}
 
     # Refresh text shader list to show enabled/disabled state
     _refresh_textshader_list()
@@ -709,12 +765,12 @@ def _generate_demo(sender=None, app_data=None, user_data=None):
             _app.status_bar.set_status("Error generating demo", (255, 100, 100))
 
 
-def _clean_compiled_files():
+def _clean_compiled_files(game_folder: str) -> int:
     """Remove all .rpyc files from the game folder for a fresh start."""
-    if not _app.game_folder:
+    if not game_folder:
         return 0
 
-    game_path = Path(_app.game_folder)
+    game_path = Path(game_folder)
     count = 0
 
     # Find and delete all .rpyc files recursively
@@ -739,6 +795,10 @@ def _clean_compiled_files():
 
 def _create_demo(sender=None, app_data=None, user_data=None):
     """Generate the demo script and run it in Ren'Py."""
+    global _launching
+    if _launching:
+        return
+
     # First generate
     _generate_demo()
 
@@ -756,16 +816,42 @@ def _create_demo(sender=None, app_data=None, user_data=None):
             _app.status_bar.set_status("Game folder not configured", (255, 100, 100))
         return
 
-    # Clean all .rpyc files for fresh compile
-    cleaned = _clean_compiled_files()
+    # Cleaning walks the whole game folder and Popen can stall on a cold
+    # start, so both run on a worker thread
+    _launching = True
+    if _app.status_bar:
+        _app.status_bar.set_status("Launching Ren'Py...", (200, 200, 100))
+    threading.Thread(
+        target=_launch_demo,
+        args=(_app.renpy_exe, _app.game_folder),
+        daemon=True
+    ).start()
 
-    # Get parent of game folder (project root)
-    project_root = str(Path(_app.game_folder).parent)
 
+def _launch_demo(renpy_exe: str, game_folder: str):
+    """Worker thread: clean compiled files and start Ren'Py.
+
+    The outcome is posted to the UI thread, which clears _launching.
+    """
+    result = ("Error launching Ren'Py", (255, 100, 100))
     try:
-        subprocess.Popen([_app.renpy_exe, project_root])
-        if _app.status_bar:
-            _app.status_bar.set_status(f"Launching Ren'Py... (cleaned {cleaned} .rpyc files)", (100, 200, 100))
+        # Clean all .rpyc files for fresh compile
+        cleaned = _clean_compiled_files(game_folder)
+
+        # Get parent of game folder (project root)
+        project_root = str(Path(game_folder).parent)
+
+        subprocess.Popen([renpy_exe, project_root], close_fds=True, **_DETACHED)
+        result = (f"Launching Ren'Py... (cleaned {cleaned} .rpyc files)", (100, 200, 100))
     except Exception as e:
-        if _app.status_bar:
-            _app.status_bar.set_status(f"Error launching Ren'Py: {e}", (255, 100, 100))
+        result = (f"Error launching Ren'Py: {e}", (255, 100, 100))
+    finally:
+        post_to_ui(lambda: _on_demo_launched(*result))
+
+
+def _on_demo_launched(message: str, color: tuple):
+    """UI thread: report the launch result and allow another launch."""
+    global _launching
+    _launching = False
+    if _app.status_bar:
+        _app.status_bar.set_status(message, color)
@@ -7,12 +7,16 @@ Handles all UI and callbacks for the Shaders tab:
 - JSON mode: Read-only JSON view
 """
 
+import heapq
+import time
 import dearpygui.dearpygui as dpg
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 
+from modules.json_manager import to_display_json
 from modules.ui_components import (
-    apply_selection_theme, hex_to_rgb, rgba_to_hex,
-    show_confirm_dialog, add_color_edit_with_hex
+    hex_to_rgb, rgba_to_hex,
+    show_confirm_dialog, add_color_edit_with_hex, set_color_edit_with_hex,
+    VirtualSelectableList, call_next_frame, is_ctrl_down, modifier_state
 )
 
 
@@ -23,6 +27,21 @@ from modules.ui_components import (
 _app = None
 _EditorMode = None
 _update_status_bar = None
+_manager_list = None  # VirtualSelectableList for the manager panel
+_builder_list = None  # VirtualSelectableList for the builder preset list
+_json_cache = (-1, "")  # (json_mgr.revision, serialized JSON view text)
+_panels: Dict[str, int] = {}  # Mode name -> panel id, captured at setup
+_builder_key = None  # (json_mgr.revision, preset name) the editor was built for
+_builder_shape = None  # (preset, shader, ((param, kind), ...)) of the built editor
+_param_widgets: Dict[str, int] = {}  # Param key -> its widget in the built editor
+_source_items = None  # shader name list last pushed into the source combo
+
+# Live param edits (drags, typing) are buffered and written once the
+# value has settled for PARAM_DEBOUNCE_SECONDS, or when the edit ends
+PARAM_DEBOUNCE_SECONDS = 0.1
+_pending_params: Dict[Tuple[str, str], Any] = {}
+_pending_deadline = 0.0
+_param_edit_handler = None  # Item handler registry flushing on edit end
 
 
 def init_shader_tab(app_state, editor_mode_enum, status_callback):
@@ -44,13 +63,114 @@ def _clean_float(value: Any) -> Any:
     return value
 
 
+# Fallback value for a shader param that declares no default
+_PARAM_TYPE_DEFAULTS = {"color": "#FFFFFF", "float": 0.0, "int": 0}
+
+
+def _param_kind(param_type: Optional[str], value: Any) -> Optional[str]:
+    """Widget kind for a param: its declared type, else inferred from value."""
+    if param_type == "color" or (isinstance(value, str) and value.startswith("#")):
+        return "color"
+    if isinstance(value, float) or param_type == "float":
+        return "float"
+    if isinstance(value, int) or param_type == "int":
+        return "int"
+    return None
+
+
+def _add_color_param(parent, name: str, key: str, value: Any) -> int:
+    widget, _ = add_color_edit_with_hex(
+        label=key,
+        default_value=value if isinstance(value, str) else "#FFFFFFFF",
+        callback=shader_param_color_callback,
+        user_data=(name, key),
+        parent=parent,
+        color_width=150,
+        include_alpha=True
+    )
+    return widget
+
+
+def _add_float_param(parent, name: str, key: str, value: Any) -> int:
+    return dpg.add_input_float(
+        label=key,
+        default_value=float(value) if value is not None else 0.0,
+        callback=shader_param_callback,
+        user_data=(name, key),
+        step=0.1,
+        parent=parent,
+        width=150
+    )
+
+
+def _add_int_param(parent, name: str, key: str, value: Any) -> int:
+    return dpg.add_input_int(
+        label=key,
+        default_value=int(value) if value is not None else 0,
+        callback=shader_param_callback,
+        user_data=(name, key),
+        parent=parent,
+        width=150
+    )
+
+
+# Param widget kind -> factory(parent, preset name, param key, value)
+_PARAM_FACTORIES = {
+    "color": _add_color_param,
+    "float": _add_float_param,
+    "int": _add_int_param,
+}
+
+
+def _set_param_value(widget: int, kind: str, value: Any):
+    """Show a new value in an existing param widget."""
+    if kind == "color":
+        set_color_edit_with_hex(widget, value if isinstance(value, str) else "#FFFFFFFF")
+    elif kind == "float":
+        dpg.set_value(widget, float(value) if value is not None else 0.0)
+    else:
+        dpg.set_value(widget, int(value) if value is not None else 0)
+
+
+def _builder_param_rows(preset: dict, shader_def) -> List[Tuple[str, str, Any]]:
+    """(key, widget kind, value) for each param the builder shows, by key."""
+    preset_params = preset.get("params", {})
+
+    # Shader params come pre-sorted; merge in the (rare) preset-only keys
+    shader_param_defs = shader_def.params_by_name if shader_def else {}
+    extra_keys = sorted(k for k in preset_params if k not in shader_param_defs)
+
+    rows = []
+    for key in heapq.merge(shader_param_defs, extra_keys):
+        if not key or key == "null":
+            continue
+
+        param_def = shader_param_defs.get(key)
+        param_type = param_def.param_type if param_def else None
+        if key in preset_params:
+            value = preset_params[key]
+        elif param_def:
+            value = param_def.default
+            if value is None:
+                value = _PARAM_TYPE_DEFAULTS.get(param_type, 0.0)
+        else:
+            continue
+
+        kind = _param_kind(param_type, value)
+        if kind is not None:
+            rows.append((key, kind, value))
+    return rows
+
+
 # =============================================================================
 # UI Setup
 # =============================================================================
 
 def setup_shader_tab(parent):
     """Build the Shaders tab UI structure."""
-    with dpg.tab(label="SHADERS", parent=parent):
+    global _manager_list, _builder_list
+
+    with dpg.tab(label="SHADERS", parent=parent, tag="shader_tab"):
         with dpg.group(horizontal=True):
             dpg.add_text("Mode:")
             dpg.add_radio_button(
@@ -87,13 +207,29 @@ def setup_shader_tab(parent):
                     dpg.add_text("Preset List")
                     dpg.add_separator()
                     with dpg.child_window(tag="shader_builder_list", width=250, height=450):
-                        pass
+                        dpg.add_text("Loading...", color=(150, 150, 150))
                 dpg.add_spacer(width=10)
                 with dpg.child_window(width=-1, height=450, tag="shader_builder_content"):
                     dpg.add_text("Select a preset to edit")
 
-        # Manager panel
+        # Manager panel (toolbar sits above the scrolling list so rows
+        # start at the top of the child window)
         with dpg.group(tag="shader_manager_panel", show=False):
+            with dpg.group(horizontal=True):
+                dpg.add_text("Selected: 0 of 0", tag="shader_manager_count")
+                dpg.add_spacer(width=10)
+                dpg.add_button(label="All", callback=shader_select_all, width=40)
+                dpg.add_button(label="None", callback=shader_select_none, width=45)
+                dpg.add_button(label="Invert", callback=shader_invert_selection, width=50)
+                dpg.add_spacer(width=20)
+                dpg.add_button(label="^^", width=25, callback=shader_move_selected_top)
+                dpg.add_button(label="^", width=25, callback=shader_move_selected_up)
+                dpg.add_button(label="v", width=25, callback=shader_move_selected_down)
+                dpg.add_button(label="vv", width=25, callback=shader_move_selected_bottom)
+                dpg.add_spacer(width=10)
+                dpg.add_button(label="Dupe", width=45, callback=shader_duplicate_selected)
+                dpg.add_button(label="Del", width=40, callback=shader_delete_selected)
+            dpg.add_separator()
             with dpg.child_window(height=-30, tag="shader_manager_list"):
                 pass
 
@@ -107,6 +243,22 @@ def setup_shader_tab(parent):
                 readonly=True
             )
 
+    _manager_list = VirtualSelectableList(
+        "shader_manager_list",
+        shader_manager_select_callback,
+        width=800,
+        label_prefix="shader_"
+    )
+    _builder_list = VirtualSelectableList(
+        "shader_builder_list",
+        shader_builder_select_callback,
+        width=230
+    )
+
+    # Resolve panel tags once; mode switches configure them by id
+    for mode_name in ("BUILDER", "MANAGER", "JSON"):
+        _panels[mode_name] = dpg.get_alias_id(f"shader_{mode_name.lower()}_panel")
+
 
 # =============================================================================
 # Mode Switching
@@ -114,14 +266,13 @@ def setup_shader_tab(parent):
 
 def switch_shader_mode(mode):
     """Switch between Builder, Manager, and JSON modes."""
+    if mode == _app.shader_mode:
+        return
     _app.shader_mode = mode
 
-    if dpg.does_item_exist("shader_builder_panel"):
-        dpg.configure_item("shader_builder_panel", show=(mode == _EditorMode.BUILDER))
-    if dpg.does_item_exist("shader_manager_panel"):
-        dpg.configure_item("shader_manager_panel", show=(mode == _EditorMode.MANAGER))
-    if dpg.does_item_exist("shader_json_panel"):
-        dpg.configure_item("shader_json_panel", show=(mode == _EditorMode.JSON))
+    # Show/hide panels
+    for mode_name, panel in _panels.items():
+        dpg.configure_item(panel, show=(mode.name == mode_name))
 
     refresh_shader_ui()
 
@@ -132,6 +283,9 @@ def switch_shader_mode(mode):
 
 def refresh_shader_ui():
     """Refresh shader tab content based on current mode."""
+    if not _app.ui_ready:
+        return
+    _app.ensure_shaders_loaded()
     if _app.shader_mode == _EditorMode.MANAGER:
         refresh_shader_manager()
     elif _app.shader_mode == _EditorMode.BUILDER:
@@ -141,53 +295,27 @@ def refresh_shader_ui():
 
 
 def refresh_shader_manager():
-    """Refresh the shader manager list."""
-    if not dpg.does_item_exist("shader_manager_list"):
+    """Refresh the shader manager list (visible rows are diffed in place)."""
+    if _manager_list is None:
         return
 
-    dpg.delete_item("shader_manager_list", children_only=True)
-
     names = _app.json_mgr.get_shader_names()
     selected = _app.shader_selection.selected
 
-    # Top toolbar
-    with dpg.group(horizontal=True, parent="shader_manager_list"):
-        dpg.add_text(f"Selected: {len(selected)} of {len(names)}")
-        dpg.add_spacer(width=10)
-        dpg.add_button(label="All", callback=shader_select_all, width=40)
-        dpg.add_button(label="None", callback=shader_select_none, width=45)
-        dpg.add_button(label="Invert", callback=shader_invert_selection, width=50)
-        dpg.add_spacer(width=20)
-        dpg.add_button(label="^^", width=25, callback=shader_move_selected_top)
-        dpg.add_button(label="^", width=25, callback=shader_move_selected_up)
-        dpg.add_button(label="v", width=25, callback=shader_move_selected_down)
-        dpg.add_button(label="vv", width=25, callback=shader_move_selected_bottom)
-        dpg.add_spacer(width=10)
-        dpg.add_button(label="Dupe", width=45, callback=shader_duplicate_selected)
-        dpg.add_button(label="Del", width=40, callback=shader_delete_selected)
-
-    dpg.add_separator(parent="shader_manager_list")
-
-    # Selectable list
-    for name in names:
-        is_selected = name in selected
-        prefix = "[*] " if is_selected else "    "
-        item_id = dpg.add_selectable(
-            label=f"{prefix}shader_{name}",
-            default_value=is_selected,
-            callback=shader_manager_select_callback,
-            user_data=name,
-            width=800,
-            parent="shader_manager_list"
-        )
-        apply_selection_theme(item_id, is_selected)
+    dpg.set_value("shader_manager_count", f"Selected: {len(selected)} of {len(names)}")
+    _manager_list.set_items(names, selected)
 
 
 def refresh_shader_builder():
-    """Refresh the shader builder panel."""
-    # Update the available shaders combo
-    if dpg.does_item_exist("shader_builder_source_combo"):
-        available = _app.shader_parser.list_available_shaders()
+    """Refresh the shader builder panel (only while the builder is shown)."""
+    global _source_items
+    if _app.shader_mode != _EditorMode.BUILDER:
+        return
+
+    # Update the available shaders combo (the list only changes on a re-parse)
+    available = _app.shader_parser.list_available_shaders()
+    if available is not _source_items and dpg.does_item_exist("shader_builder_source_combo"):
+        _source_items = available
         dpg.configure_item("shader_builder_source_combo", items=available)
         if available and not dpg.get_value("shader_builder_source_combo"):
             dpg.set_value("shader_builder_source_combo", available[0])
@@ -198,41 +326,50 @@ def refresh_shader_builder():
 
 def refresh_shader_builder_list():
     """Refresh the shader builder list panel."""
-    if not dpg.does_item_exist("shader_builder_list"):
+    if _builder_list is None:
         return
-
-    dpg.delete_item("shader_builder_list", children_only=True)
-
-    presets = _app.json_mgr.get_shader_names()
-    for name in presets:
-        is_selected = name in _app.shader_selection.selected
-        prefix = "[*] " if is_selected else "    "
-        item_id = dpg.add_selectable(
-            label=f"{prefix}{name}",
-            default_value=is_selected,
-            callback=shader_builder_select_callback,
-            user_data=name,
-            width=230,
-            parent="shader_builder_list"
-        )
-        apply_selection_theme(item_id, is_selected)
+    _builder_list.set_items(_app.json_mgr.get_shader_names(), _app.shader_selection.selected)
 
 
 def refresh_shader_builder_content():
-    """Refresh the shader builder content/editor panel."""
+    """Refresh the shader builder content/editor panel.
+
+    The editor is rebuilt only when the preset, its shader, or its set of
+    params changes; otherwise the existing param widgets get the new values.
+    """
+    global _builder_key, _builder_shape, _param_widgets
     if not dpg.does_item_exist("shader_builder_content"):
         return
 
+    # Nothing changed since the last build (e.g. switching back from another mode)
+    name = _app.shader_selection.single()
+    key = (_app.json_mgr.revision, name)
+    if key == _builder_key:
+        return
+    _builder_key = key
+
+    preset = _app.json_mgr.get_shader(name) if name else None
+    if preset:
+        shader_name = preset.get("shader", "")
+        shader_def = _app.shader_parser.get_shader(shader_name)
+        rows = _builder_param_rows(preset, shader_def)
+        shape = (name, shader_name, tuple((k, kind) for k, kind, _ in rows))
+        if shape == _builder_shape and all(dpg.does_item_exist(w) for w in _param_widgets.values()):
+            for param, kind, value in rows:
+                # Leave widgets with a buffered edit showing the user's value
+                if (name, param) not in _pending_params:
+                    _set_param_value(_param_widgets[param], kind, value)
+            return
+
     dpg.delete_item("shader_builder_content", children_only=True)
+    _builder_shape = None
+    _param_widgets = {}
 
-    selected = _app.shader_selection.selected
-    if len(selected) != 1:
+    if name is None:
         dpg.add_text("Select a single preset to edit",
                     parent="shader_builder_content")
         return
 
-    name = selected[0]
-    preset = _app.json_mgr.get_shader(name)
     if not preset:
         dpg.add_text(f"Preset '{name}' not found",
                     parent="shader_builder_content")
@@ -258,7 +395,6 @@ def refresh_shader_builder_content():
     dpg.add_separator(parent=parent)
 
     # Shader name (read-only)
-    shader_name = preset.get("shader", "")
     dpg.add_input_text(
         label="Shader",
         default_value=shader_name,
@@ -267,7 +403,6 @@ def refresh_shader_builder_content():
     )
 
     # Shader description from parsed shader file
-    shader_def = _app.shader_parser.get_shader(shader_name)
     if shader_def:
         desc = shader_def.file_description
         if desc:
@@ -279,82 +414,26 @@ def refresh_shader_builder_content():
     dpg.add_separator(parent=parent)
     dpg.add_text("Parameters", parent=parent)
 
-    preset_params = preset.get("params", {})
-
-    # Get param definitions from shader
-    shader_param_defs = {}
-    if shader_def:
-        for p in shader_def.params:
-            shader_param_defs[p.name] = p
-
-    # Merge preset values with shader defaults
-    all_param_keys = set(preset_params.keys()) | set(shader_param_defs.keys())
-
-    for key in sorted(all_param_keys):
-        if not key or key == "null":
-            continue
-
-        # Get value
-        if key in preset_params:
-            value = preset_params[key]
-        elif key in shader_param_defs:
-            value = shader_param_defs[key].default
-            if value is None:
-                ptype = shader_param_defs[key].param_type
-                if ptype == "color":
-                    value = "#FFFFFF"
-                elif ptype == "float":
-                    value = 0.0
-                elif ptype == "int":
-                    value = 0
-                else:
-                    value = 0.0
-        else:
-            continue
-
-        # Determine type
-        param_type = None
-        if key in shader_param_defs:
-            param_type = shader_param_defs[key].param_type
-
-        if param_type == "color" or (isinstance(value, str) and value.startswith("#")):
-            hex_value = value if isinstance(value, str) else "#FFFFFFFF"
-            add_color_edit_with_hex(
-                label=key,
-                default_value=hex_value,
-                callback=shader_param_color_callback,
-                user_data=(name, key),
-                parent=parent,
-                color_width=150,
-                include_alpha=True
-            )
-        elif isinstance(value, float) or param_type == "float":
-            dpg.add_input_float(
-                label=key,
-                default_value=float(value) if value is not None else 0.0,
-                callback=shader_param_callback,
-                user_data=(name, key),
-                step=0.1,
-                parent=parent,
-                width=150
-            )
-        elif isinstance(value, int) or param_type == "int":
-            dpg.add_input_int(
-                label=key,
-                default_value=int(value) if value is not None else 0,
-                callback=shader_param_callback,
-                user_data=(name, key),
-                parent=parent,
-                width=150
-            )
+    for param, kind, value in rows:
+        widget = _PARAM_FACTORIES[kind](parent, name, param, value)
+        dpg.bind_item_handler_registry(widget, _get_param_edit_handler())
+        _param_widgets[param] = widget
+    _builder_shape = shape
 
 
 def refresh_shader_json():
-    """Refresh the shader JSON view."""
-    import json
-    if dpg.does_item_exist("shader_json_text"):
-        text = json.dumps(_app.json_mgr.shader_data, indent=2)
-        dpg.set_value("shader_json_text", text)
+    """Refresh the shader JSON view (only while the JSON panel is shown)."""
+    global _json_cache
+    if _app.shader_mode != _EditorMode.JSON:
+        return
+    if not dpg.does_item_exist("shader_json_text"):
+        return
+
+    # Re-serialize only when the data changed since the last refresh
+    revision = _app.json_mgr.revision
+    if _json_cache[0] != revision:
+        _json_cache = (revision, to_display_json(_app.json_mgr.shader_data))
+        dpg.set_value("shader_json_text", _json_cache[1])
 
 
 # =============================================================================
@@ -366,8 +445,7 @@ def shader_manager_select_callback(sender, app_data, user_data):
 
 
 def shader_manager_select(name: str):
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
-    shift = dpg.is_key_down(dpg.mvKey_LShift) or dpg.is_key_down(dpg.mvKey_RShift)
+    ctrl, shift = modifier_state()
     _app.shader_selection.handle_click(name, ctrl, shift)
     refresh_shader_manager()
 
@@ -377,22 +455,19 @@ def shader_builder_select_callback(sender, app_data, user_data):
 
 
 def shader_builder_select(name: str):
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
+    ctrl = is_ctrl_down()
     old_selection = list(_app.shader_selection.selected)
 
     if ctrl:
-        if name in _app.shader_selection.selected:
-            _app.shader_selection.selected.remove(name)
-        else:
-            _app.shader_selection.selected.append(name)
+        _app.shader_selection.toggle(name)
     else:
-        _app.shader_selection.selected = [name]
+        _app.shader_selection.select([name])
 
     refresh_shader_builder_list()
 
     # Only refresh content if selection actually changed
     # This prevents destroying widgets before their callbacks fire
-    if _app.shader_selection.selected != old_selection:
+    if list(_app.shader_selection.selected) != old_selection:
         refresh_shader_builder_content()
 
 
@@ -420,26 +495,26 @@ def shader_invert_selection():
 # =============================================================================
 
 def shader_move_selected_top():
-    for name in reversed(_app.shader_selection.selected):
-        _app.json_mgr.move_shader(name, "top")
+    _flush_param_updates()
+    _app.json_mgr.move_shaders(_app.shader_selection.selected, "top")
     refresh_shader_manager()
 
 
 def shader_move_selected_up():
-    for name in _app.shader_selection.selected:
-        _app.json_mgr.move_shader(name, "up")
+    _flush_param_updates()
+    _app.json_mgr.move_shaders(_app.shader_selection.selected, "up")
     refresh_shader_manager()
 
 
 def shader_move_selected_down():
-    for name in reversed(_app.shader_selection.selected):
-        _app.json_mgr.move_shader(name, "down")
+    _flush_param_updates()
+    _app.json_mgr.move_shaders(_app.shader_selection.selected, "down")
     refresh_shader_manager()
 
 
 def shader_move_selected_bottom():
-    for name in _app.shader_selection.selected:
-        _app.json_mgr.move_shader(name, "bottom")
+    _flush_param_updates()
+    _app.json_mgr.move_shaders(_app.shader_selection.selected, "bottom")
     refresh_shader_manager()
 
 
@@ -448,10 +523,12 @@ def shader_move_selected_bottom():
 # =============================================================================
 
 def shader_duplicate_selected():
-    selected = _app.shader_selection.selected.copy()
-    for name in selected:
-        new_name = _app.json_mgr.get_unique_shader_name(f"{name}_copy")
-        _app.json_mgr.duplicate_shader(name, new_name)
+    _flush_param_updates()
+    selected = list(_app.shader_selection.selected)
+    with _app.json_mgr.batch():
+        for name in selected:
+            new_name = _app.json_mgr.get_unique_shader_name(f"{name}_copy")
+            _app.json_mgr.duplicate_shader(name, new_name)
     _app.shader_selection.update_items(_app.json_mgr.get_shader_names())
     refresh_shader_manager()
     if _update_status_bar:
@@ -459,13 +536,14 @@ def shader_duplicate_selected():
 
 
 def shader_delete_selected():
-    selected = _app.shader_selection.selected.copy()
+    selected = list(_app.shader_selection.selected)
     if not selected:
         return
 
     def do_delete():
+        _flush_param_updates()
         _app.json_mgr.delete_shaders(selected)
-        _app.shader_selection.selected = []
+        _app.shader_selection.select_none()
         _app.shader_selection.update_items(_app.json_mgr.get_shader_names())
         refresh_shader_manager()
         if _update_status_bar:
@@ -520,7 +598,7 @@ def shader_builder_create_new():
 
     _app.json_mgr.add_shader(new_name, preset_data)
     _app.shader_selection.update_items(_app.json_mgr.get_shader_names())
-    _app.shader_selection.selected = [new_name]
+    _app.shader_selection.select([new_name])
     refresh_shader_builder()
     if _update_status_bar:
         _update_status_bar()
@@ -537,7 +615,7 @@ def add_new_shader():
         }
     })
     _app.shader_selection.update_items(_app.json_mgr.get_shader_names())
-    _app.shader_selection.selected = [name]
+    _app.shader_selection.select([name])
     refresh_shader_ui()
     if _update_status_bar:
         _update_status_bar()
@@ -550,7 +628,7 @@ def add_new_shader():
 def shader_param_callback(sender, app_data, user_data):
     if user_data:
         name, param = user_data
-        shader_update_param(name, param, _clean_float(app_data))
+        _queue_param_update(name, param, _clean_float(app_data))
 
 
 def shader_param_color_callback(sender, app_data, user_data):
@@ -558,7 +636,55 @@ def shader_param_color_callback(sender, app_data, user_data):
     if user_data:
         name, param = user_data
         # app_data is already a hex string from add_color_edit_with_hex
-        shader_update_param(name, param, app_data)
+        _queue_param_update(name, param, app_data)
+
+
+def _get_param_edit_handler():
+    """Shared handler registry that writes pending edits when a widget is released."""
+    global _param_edit_handler
+    if _param_edit_handler is None:
+        with dpg.item_handler_registry() as _param_edit_handler:
+            dpg.add_item_deactivated_after_edit_handler(callback=_flush_param_updates)
+    return _param_edit_handler
+
+
+def _queue_param_update(name: str, param: str, value):
+    """Buffer a live param edit; later edits of the same param replace it."""
+    global _pending_deadline
+    _pending_params[(name, param)] = value
+    _pending_deadline = time.monotonic() + PARAM_DEBOUNCE_SECONDS
+    call_next_frame("shader_params", _flush_param_updates_when_idle)
+
+
+def _flush_param_updates_when_idle():
+    """Frame callback: flush once edits have settled, otherwise check again next frame."""
+    if time.monotonic() < _pending_deadline:
+        call_next_frame("shader_params", _flush_param_updates_when_idle)
+        return
+    _flush_param_updates()
+
+
+def _flush_param_updates(sender=None, app_data=None, user_data=None):
+    """Write all buffered param edits as one save and one change notification."""
+    if not _pending_params:
+        return
+    # Presets renamed or deleted since the edit are gone; writing would recreate them
+    updates = {key: value for key, value in _pending_params.items()
+               if _app.json_mgr.get_shader(key[0]) is not None}
+    _pending_params.clear()
+    if not updates:
+        return
+    with _app.json_mgr.batch():
+        for (name, param), value in updates.items():
+            shader_update_param(name, param, value)
+    # The batch notifies (and moves the revision) once more on exit
+    for name in {name for name, _ in updates}:
+        _mark_builder_current(name)
+
+
+def flush_shader_edits():
+    """Write buffered param edits now, before undo/redo or a reload."""
+    _flush_param_updates()
 
 
 def shader_rename_callback(sender, app_data, user_data):
@@ -576,17 +702,22 @@ def shader_update_name_button_callback(sender, app_data, user_data):
 # Data Operations
 # =============================================================================
 
+def _mark_builder_current(name: str):
+    """The editor already shows name's latest values; skip its next rebuild."""
+    global _builder_key
+    if _builder_key is not None and _builder_key[1] == name:
+        _builder_key = (_app.json_mgr.revision, name)
+
+
 def shader_update_param(name: str, param: str, value):
     """Update a shader parameter value."""
     print(f"[DEBUG] shader_update_param: name={name}, param={param}, value={value}")
     if not param or param == "null":
         return
 
-    preset = _app.json_mgr.get_shader(name) or {}
-    if "params" not in preset:
-        preset["params"] = {}
-    preset["params"][param] = value
-    _app.json_mgr.set_shader(name, preset)
+    with _app.json_mgr.mutate_shader(name, ("params", param)) as preset:
+        preset.setdefault("params", {})[param] = value
+    _mark_builder_current(name)
     if _update_status_bar:
         _update_status_bar()
 
@@ -596,14 +727,10 @@ def shader_rename_preset(old_name: str, new_name: str):
     new_name = new_name.strip()
     if not new_name or new_name == old_name:
         return
-    if _app.json_mgr.get_shader(new_name):
-        return
-    preset = _app.json_mgr.get_shader(old_name)
-    if preset:
-        _app.json_mgr.set_shader(new_name, preset)
-        _app.json_mgr.delete_shader(old_name)
+    _flush_param_updates()  # Buffered edits are keyed by the old name
+    if _app.json_mgr.rename_shader(old_name, new_name):
         _app.shader_selection.update_items(_app.json_mgr.get_shader_names())
-        _app.shader_selection.selected = [new_name]
+        _app.shader_selection.select([new_name])
         refresh_shader_ui()
         if _update_status_bar:
             _update_status_bar()
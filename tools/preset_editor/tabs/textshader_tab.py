@@ -15,11 +15,13 @@ import dearpygui.dearpygui as dpg
 import os
 import time
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List
 
+from modules.json_manager import to_display_json
 from modules.ui_components import (
-    apply_selection_theme, hex_to_rgb, rgba_to_hex,
-    show_confirm_dialog, add_color_edit_with_hex
+    hex_to_rgb, rgba_to_hex,
+    show_confirm_dialog, add_color_edit_with_hex, VirtualSelectableList,
+    is_ctrl_down, modifier_state
 )
 
 
@@ -49,6 +51,12 @@ BUILTIN_TEXT_SHADERS = [
 _app = None
 _EditorMode = None
 _update_status_bar = None
+_manager_list = None  # VirtualSelectableList for the manager panel
+_builder_list = None  # VirtualSelectableList for the builder preset list
+_json_cache = (-1, "")  # (json_mgr.revision, serialized JSON view text)
+_panels: Dict[str, int] = {}  # Mode name -> panel id, captured at setup
+_all_shaders = (None, [])  # (parser name list, get_all_text_shaders() result)
+_source_items = None  # shader name list last pushed into the source combo
 
 
 def init_textshader_tab(app_state, editor_mode_enum, status_callback):
@@ -71,17 +79,27 @@ def _clean_float(value: Any) -> Any:
 
 
 def get_all_text_shaders() -> List[str]:
-    """Get all available text shaders: built-in + custom from parsed files."""
+    """Get all available text shaders: built-in + custom from parsed files.
+
+    The same list object is returned until the parser re-parses; don't mutate it.
+    """
+    global _all_shaders
+    custom = None
+    if _app and _app.text_shader_parser:
+        custom = _app.text_shader_parser.list_available_text_shaders()
+    if custom is not None and custom is _all_shaders[0]:
+        return _all_shaders[1]
+
     shaders = ["(none)"]  # Always start with no shader option
     shaders.extend(BUILTIN_TEXT_SHADERS)
 
     # Add custom text shaders from parsed files
-    if _app and _app.text_shader_parser:
-        custom = _app.text_shader_parser.list_available_text_shaders()
+    if custom:
         for name in custom:
             if name not in shaders:
                 shaders.append(name)
 
+    _all_shaders = (custom, shaders)
     return shaders
 
 
@@ -107,7 +125,9 @@ def get_available_fonts() -> List[str]:
 
 def setup_textshader_tab(parent):
     """Build the Text Shaders tab UI structure."""
-    with dpg.tab(label="TEXT SHADERS", parent=parent):
+    global _manager_list, _builder_list
+
+    with dpg.tab(label="TEXT SHADERS", parent=parent, tag="textshader_tab"):
         with dpg.group(horizontal=True):
             dpg.add_text("Mode:")
             dpg.add_radio_button(
@@ -144,13 +164,29 @@ def setup_textshader_tab(parent):
                     dpg.add_text("Preset List")
                     dpg.add_separator()
                     with dpg.child_window(tag="textshader_builder_list", width=250, height=500):
-                        pass
+                        dpg.add_text("Loading...", color=(150, 150, 150))
                 dpg.add_spacer(width=10)
                 with dpg.child_window(width=-1, height=500, tag="textshader_builder_content"):
                     dpg.add_text("Select a preset to edit")
 
-        # Manager panel
+        # Manager panel (toolbar sits above the scrolling list so rows
+        # start at the top of the child window)
         with dpg.group(tag="textshader_manager_panel", show=False):
+            with dpg.group(horizontal=True):
+                dpg.add_text("Selected: 0 of 0", tag="textshader_manager_count")
+                dpg.add_spacer(width=10)
+                dpg.add_button(label="All", callback=textshader_select_all, width=40)
+                dpg.add_button(label="None", callback=textshader_select_none, width=45)
+                dpg.add_button(label="Invert", callback=textshader_invert_selection, width=50)
+                dpg.add_spacer(width=20)
+                dpg.add_button(label="^^", width=25, callback=textshader_move_selected_top)
+                dpg.add_button(label="^", width=25, callback=textshader_move_selected_up)
+                dpg.add_button(label="v", width=25, callback=textshader_move_selected_down)
+                dpg.add_button(label="vv", width=25, callback=textshader_move_selected_bottom)
+                dpg.add_spacer(width=10)
+                dpg.add_button(label="Dupe", width=45, callback=textshader_duplicate_selected)
+                dpg.add_button(label="Del", width=40, callback=textshader_delete_selected)
+            dpg.add_separator()
             with dpg.child_window(height=-30, tag="textshader_manager_list"):
                 pass
 
@@ -164,6 +200,22 @@ def setup_textshader_tab(parent):
                 readonly=True
             )
 
+    _manager_list = VirtualSelectableList(
+        "textshader_manager_list",
+        textshader_manager_select_callback,
+        width=800,
+        label_prefix="text_"
+    )
+    _builder_list = VirtualSelectableList(
+        "textshader_builder_list",
+        textshader_builder_select_callback,
+        width=230
+    )
+
+    # Resolve panel tags once; mode switches configure them by id
+    for mode_name in ("BUILDER", "MANAGER", "JSON"):
+        _panels[mode_name] = dpg.get_alias_id(f"textshader_{mode_name.lower()}_panel")
+
 
 # =============================================================================
 # Mode Switching
@@ -171,14 +223,13 @@ def setup_textshader_tab(parent):
 
 def switch_textshader_mode(mode):
     """Switch between Builder, Manager, and JSON modes."""
+    if mode == _app.textshader_mode:
+        return
     _app.textshader_mode = mode
 
-    if dpg.does_item_exist("textshader_builder_panel"):
-        dpg.configure_item("textshader_builder_panel", show=(mode == _EditorMode.BUILDER))
-    if dpg.does_item_exist("textshader_manager_panel"):
-        dpg.configure_item("textshader_manager_panel", show=(mode == _EditorMode.MANAGER))
-    if dpg.does_item_exist("textshader_json_panel"):
-        dpg.configure_item("textshader_json_panel", show=(mode == _EditorMode.JSON))
+    # Show/hide panels
+    for mode_name, panel in _panels.items():
+        dpg.configure_item(panel, show=(mode.name == mode_name))
 
     refresh_textshader_ui()
 
@@ -189,6 +240,8 @@ def switch_textshader_mode(mode):
 
 def refresh_textshader_ui():
     """Refresh text shader tab content based on current mode."""
+    if not _app.ui_ready:
+        return
     if _app.textshader_mode == _EditorMode.MANAGER:
         refresh_textshader_manager()
     elif _app.textshader_mode == _EditorMode.BUILDER:
@@ -198,53 +251,24 @@ def refresh_textshader_ui():
 
 
 def refresh_textshader_manager():
-    """Refresh the text shader manager list."""
-    if not dpg.does_item_exist("textshader_manager_list"):
+    """Refresh the text shader manager list (visible rows are diffed in place)."""
+    if _manager_list is None:
         return
 
-    dpg.delete_item("textshader_manager_list", children_only=True)
-
     names = _app.json_mgr.get_textshader_names()
     selected = _app.textshader_selection.selected
 
-    # Top toolbar
-    with dpg.group(horizontal=True, parent="textshader_manager_list"):
-        dpg.add_text(f"Selected: {len(selected)} of {len(names)}")
-        dpg.add_spacer(width=10)
-        dpg.add_button(label="All", callback=textshader_select_all, width=40)
-        dpg.add_button(label="None", callback=textshader_select_none, width=45)
-        dpg.add_button(label="Invert", callback=textshader_invert_selection, width=50)
-        dpg.add_spacer(width=20)
-        dpg.add_button(label="^^", width=25, callback=textshader_move_selected_top)
-        dpg.add_button(label="^", width=25, callback=textshader_move_selected_up)
-        dpg.add_button(label="v", width=25, callback=textshader_move_selected_down)
-        dpg.add_button(label="vv", width=25, callback=textshader_move_selected_bottom)
-        dpg.add_spacer(width=10)
-        dpg.add_button(label="Dupe", width=45, callback=textshader_duplicate_selected)
-        dpg.add_button(label="Del", width=40, callback=textshader_delete_selected)
-
-    dpg.add_separator(parent="textshader_manager_list")
-
-    # Selectable list
-    for name in names:
-        is_selected = name in selected
-        prefix = "[*] " if is_selected else "    "
-        item_id = dpg.add_selectable(
-            label=f"{prefix}text_{name}",
-            default_value=is_selected,
-            callback=textshader_manager_select_callback,
-            user_data=name,
-            width=800,
-            parent="textshader_manager_list"
-        )
-        apply_selection_theme(item_id, is_selected)
+    dpg.set_value("textshader_manager_count", f"Selected: {len(selected)} of {len(names)}")
+    _manager_list.set_items(names, selected)
 
 
 def refresh_textshader_builder():
     """Refresh the text shader builder panel."""
-    # Update the available text shaders combo
-    if dpg.does_item_exist("textshader_builder_source_combo"):
-        available = get_all_text_shaders()
+    global _source_items
+    # Update the available text shaders combo (the list only changes on a re-parse)
+    available = get_all_text_shaders()
+    if available is not _source_items and dpg.does_item_exist("textshader_builder_source_combo"):
+        _source_items = available
         dpg.configure_item("textshader_builder_source_combo", items=available)
         current = dpg.get_value("textshader_builder_source_combo")
         if not current or current not in available:
@@ -256,24 +280,9 @@ def refresh_textshader_builder():
 
 def refresh_textshader_builder_list():
     """Refresh the text shader builder list panel."""
-    if not dpg.does_item_exist("textshader_builder_list"):
+    if _builder_list is None:
         return
-
-    dpg.delete_item("textshader_builder_list", children_only=True)
-
-    presets = _app.json_mgr.get_textshader_names()
-    for name in presets:
-        is_selected = name in _app.textshader_selection.selected
-        prefix = "[*] " if is_selected else "    "
-        item_id = dpg.add_selectable(
-            label=f"{prefix}{name}",
-            default_value=is_selected,
-            callback=textshader_builder_select_callback,
-            user_data=name,
-            width=230,
-            parent="textshader_builder_list"
-        )
-        apply_selection_theme(item_id, is_selected)
+    _builder_list.set_items(_app.json_mgr.get_textshader_names(), _app.textshader_selection.selected)
 
 
 def refresh_textshader_builder_content():
@@ -283,13 +292,12 @@ def refresh_textshader_builder_content():
 
     dpg.delete_item("textshader_builder_content", children_only=True)
 
-    selected = _app.textshader_selection.selected
-    if len(selected) != 1:
+    name = _app.textshader_selection.single()
+    if name is None:
         dpg.add_text("Select a single preset to edit",
                     parent="textshader_builder_content")
         return
 
-    name = selected[0]
     preset = _app.json_mgr.get_textshader(name)
     if not preset:
         dpg.add_text(f"Preset '{name}' not found",
@@ -531,11 +539,18 @@ def refresh_textshader_builder_content():
 
 
 def refresh_textshader_json():
-    """Refresh the text shader JSON view."""
-    import json
-    if dpg.does_item_exist("textshader_json_text"):
-        text = json.dumps(_app.json_mgr.textshader_data, indent=2)
-        dpg.set_value("textshader_json_text", text)
+    """Refresh the text shader JSON view (only while the JSON panel is shown)."""
+    global _json_cache
+    if _app.textshader_mode != _EditorMode.JSON:
+        return
+    if not dpg.does_item_exist("textshader_json_text"):
+        return
+
+    # Re-serialize only when the data changed since the last refresh
+    revision = _app.json_mgr.revision
+    if _json_cache[0] != revision:
+        _json_cache = (revision, to_display_json(_app.json_mgr.textshader_data))
+        dpg.set_value("textshader_json_text", _json_cache[1])
 
 
 # =============================================================================
@@ -547,8 +562,7 @@ def textshader_manager_select_callback(sender, app_data, user_data):
 
 
 def textshader_manager_select(name: str):
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
-    shift = dpg.is_key_down(dpg.mvKey_LShift) or dpg.is_key_down(dpg.mvKey_RShift)
+    ctrl, shift = modifier_state()
     _app.textshader_selection.handle_click(name, ctrl, shift)
     refresh_textshader_manager()
 
@@ -558,22 +572,19 @@ def textshader_builder_select_callback(sender, app_data, user_data):
 
 
 def textshader_builder_select(name: str):
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
+    ctrl = is_ctrl_down()
     old_selection = list(_app.textshader_selection.selected)
 
     if ctrl:
-        if name in _app.textshader_selection.selected:
-            _app.textshader_selection.selected.remove(name)
-        else:
-            _app.textshader_selection.selected.append(name)
+        _app.textshader_selection.toggle(name)
     else:
-        _app.textshader_selection.selected = [name]
+        _app.textshader_selection.select([name])
 
     refresh_textshader_builder_list()
 
     # Only refresh content if selection actually changed
     # This prevents destroying widgets before their callbacks fire
-    if _app.textshader_selection.selected != old_selection:
+    if list(_app.textshader_selection.selected) != old_selection:
         refresh_textshader_builder_content()
 
 
@@ -601,26 +612,22 @@ def textshader_invert_selection():
 # =============================================================================
 
 def textshader_move_selected_top():
-    for name in reversed(_app.textshader_selection.selected):
-        _app.json_mgr.move_textshader(name, "top")
+    _app.json_mgr.move_textshaders(_app.textshader_selection.selected, "top")
     refresh_textshader_manager()
 
 
 def textshader_move_selected_up():
-    for name in _app.textshader_selection.selected:
-        _app.json_mgr.move_textshader(name, "up")
+    _app.json_mgr.move_textshaders(_app.textshader_selection.selected, "up")
     refresh_textshader_manager()
 
 
 def textshader_move_selected_down():
-    for name in reversed(_app.textshader_selection.selected):
-        _app.json_mgr.move_textshader(name, "down")
+    _app.json_mgr.move_textshaders(_app.textshader_selection.selected, "down")
     refresh_textshader_manager()
 
 
 def textshader_move_selected_bottom():
-    for name in _app.textshader_selection.selected:
-        _app.json_mgr.move_textshader(name, "bottom")
+    _app.json_mgr.move_textshaders(_app.textshader_selection.selected, "bottom")
     refresh_textshader_manager()
 
 
@@ -629,10 +636,11 @@ def textshader_move_selected_bottom():
 # =============================================================================
 
 def textshader_duplicate_selected():
-    selected = _app.textshader_selection.selected.copy()
-    for name in selected:
-        new_name = _app.json_mgr.get_unique_textshader_name(f"{name}_copy")
-        _app.json_mgr.duplicate_textshader(name, new_name)
+    selected = list(_app.textshader_selection.selected)
+    with _app.json_mgr.batch():
+        for name in selected:
+            new_name = _app.json_mgr.get_unique_textshader_name(f"{name}_copy")
+            _app.json_mgr.duplicate_textshader(name, new_name)
     _app.textshader_selection.update_items(_app.json_mgr.get_textshader_names())
     refresh_textshader_manager()
     if _update_status_bar:
@@ -640,13 +648,13 @@ def textshader_duplicate_selected():
 
 
 def textshader_delete_selected():
-    selected = _app.textshader_selection.selected.copy()
+    selected = list(_app.textshader_selection.selected)
     if not selected:
         return
 
     def do_delete():
         _app.json_mgr.delete_textshaders(selected)
-        _app.textshader_selection.selected = []
+        _app.textshader_selection.select_none()
         _app.textshader_selection.update_items(_app.json_mgr.get_textshader_names())
         refresh_textshader_manager()
         if _update_status_bar:
@@ -710,7 +718,7 @@ def textshader_builder_create_new():
 
     _app.json_mgr.add_textshader(new_name, preset_data)
     _app.textshader_selection.update_items(_app.json_mgr.get_textshader_names())
-    _app.textshader_selection.selected = [new_name]
+    _app.textshader_selection.select([new_name])
     refresh_textshader_builder()
     if _update_status_bar:
         _update_status_bar()
@@ -737,7 +745,7 @@ def add_new_textshader():
         }
     })
     _app.textshader_selection.update_items(_app.json_mgr.get_textshader_names())
-    _app.textshader_selection.selected = [name]
+    _app.textshader_selection.select([name])
     refresh_textshader_ui()
     if _update_status_bar:
         _update_status_bar()
@@ -971,14 +979,9 @@ def textshader_rename_preset(old_name: str, new_name: str):
     new_name = new_name.strip()
     if not new_name or new_name == old_name:
         return
-    if _app.json_mgr.get_textshader(new_name):
-        return
-    preset = _app.json_mgr.get_textshader(old_name)
-    if preset:
-        _app.json_mgr.set_textshader(new_name, preset)
-        _app.json_mgr.delete_textshader(old_name)
+    if _app.json_mgr.rename_textshader(old_name, new_name):
         _app.textshader_selection.update_items(_app.json_mgr.get_textshader_names())
-        _app.textshader_selection.selected = [new_name]
+        _app.textshader_selection.select([new_name])
         refresh_textshader_ui()
         if _update_status_bar:
             _update_status_bar()
@@ -8,9 +8,10 @@ Handles all UI and callbacks for the Transitions tab:
 """
 
 import dearpygui.dearpygui as dpg
-from typing import Any
+from typing import Any, Dict
 
-from modules.ui_components import apply_selection_theme
+from modules.json_manager import to_display_json
+from modules.ui_components import VirtualSelectableList, is_ctrl_down, modifier_state
 
 
 # =============================================================================
@@ -20,6 +21,11 @@ from modules.ui_components import apply_selection_theme
 _app = None  # Reference to AppState
 _EditorMode = None  # Reference to EditorMode enum
 _update_status_bar = None  # Callback to update status bar
+_manager_list = None  # VirtualSelectableList for the manager panel
+_builder_list = None  # VirtualSelectableList for the builder preset list
+_builder_layout = None  # (name, start_align, end_align) the builder widgets show
+_json_cache = (-1, "")  # (json_mgr.revision, serialized JSON view text)
+_panels: Dict[str, int] = {}  # Mode name -> panel id, captured at setup
 
 
 def init_transition_tab(app_state, editor_mode_enum, status_callback):
@@ -41,13 +47,83 @@ def _clean_float(value: Any) -> Any:
     return value
 
 
+def _builder_tag(field: str) -> str:
+    """Tag of the builder widget bound to one preset field."""
+    return f"trans_builder_{field}"
+
+
+def _builder_user_data(name: str) -> Dict[str, Any]:
+    """user_data for each builder widget when editing the named preset."""
+    return {
+        "name": name,
+        "update_name": (name, _builder_tag("name")),
+        "duration": (name, "duration"),
+        "easing": (name, "easing"),
+        "start_align": name,
+        "start_x": name,
+        "start_y": name,
+        "end_align": name,
+        "end_x": name,
+        "end_y": name,
+        "alpha_start": (name, "alpha", "start"),
+        "alpha_end": (name, "alpha", "end"),
+        "scale_start": (name, "scale", "start"),
+        "scale_end": (name, "scale", "end"),
+        "rotation_start": (name, "rotation", "start"),
+        "rotation_end": (name, "rotation", "end"),
+    }
+
+
+def _transition_builder_values(name: str, preset: dict) -> Dict[str, Any]:
+    """Flatten a preset into the values shown by the builder inputs."""
+    start_pos = preset.get("start_position", {})
+    end_pos = preset.get("end_position", {})
+    alpha = preset.get("alpha", {"start": 1.0, "end": 1.0})
+    scale = preset.get("scale", {"start": 1.0, "end": 1.0})
+    rotation = preset.get("rotation", {"start": 0, "end": 0})
+    return {
+        "name": name,
+        "duration": preset.get("duration", 0.4),
+        "easing": preset.get("easing", "easeout"),
+        "start_align": "xalign" in start_pos or "yalign" in start_pos,
+        "start_x": start_pos.get("xalign", start_pos.get("xoffset", 0.0)),
+        "start_y": start_pos.get("yalign", start_pos.get("yoffset", 0.0)),
+        "end_align": "xalign" in end_pos or "yalign" in end_pos,
+        "end_x": end_pos.get("xalign", end_pos.get("xoffset", 0.0)),
+        "end_y": end_pos.get("yalign", end_pos.get("yoffset", 0.0)),
+        "alpha_start": alpha.get("start", 1.0),
+        "alpha_end": alpha.get("end", 1.0),
+        "scale_start": scale.get("start", 1.0),
+        "scale_end": scale.get("end", 1.0),
+        "rotation_start": int(rotation.get("start", 0)),
+        "rotation_end": int(rotation.get("end", 0)),
+    }
+
+
+def _apply_position_mode(section: str, is_align: bool):
+    """Relabel a built position section for align (0-1) or offset (pixels) mode."""
+    active, inactive = (150, 255, 150), (150, 150, 150)
+    dpg.configure_item(_builder_tag(f"{section}_offset_label"),
+                       color=inactive if is_align else active)
+    dpg.configure_item(_builder_tag(f"{section}_align_label"),
+                       color=active if is_align else inactive)
+    for axis in ("x", "y"):
+        dpg.configure_item(
+            _builder_tag(f"{section}_{axis}"),
+            label=f"{axis}align" if is_align else f"{axis}offset",
+            step=0.1 if is_align else 10.0
+        )
+
+
 # =============================================================================
 # UI Setup
 # =============================================================================
 
 def setup_transition_tab(parent):
     """Build the Transitions tab UI structure."""
-    with dpg.tab(label="TRANSITIONS", parent=parent):
+    global _manager_list, _builder_list
+
+    with dpg.tab(label="TRANSITIONS", parent=parent, tag="trans_tab"):
         # Mode selector and actions
         with dpg.group(horizontal=True):
             dpg.add_text("Mode:")
@@ -68,13 +144,28 @@ def setup_transition_tab(parent):
                 dpg.add_text("Preset List")
                 dpg.add_separator()
                 with dpg.child_window(tag="trans_builder_list", width=250, height=500):
-                    pass
+                    dpg.add_text("Loading...", color=(150, 150, 150))
             dpg.add_spacer(width=10)
             with dpg.child_window(width=-1, height=500, tag="trans_builder_content"):
                 dpg.add_text("Select a preset to edit")
 
-        # Manager panel
+        # Manager panel (toolbar sits above the scrolling list)
         with dpg.group(tag="trans_manager_panel", show=False):
+            with dpg.group(horizontal=True):
+                dpg.add_text("Selected: 0 of 0", tag="trans_manager_count")
+                dpg.add_spacer(width=10)
+                dpg.add_button(label="All", callback=trans_select_all, width=40)
+                dpg.add_button(label="None", callback=trans_select_none, width=45)
+                dpg.add_button(label="Invert", callback=trans_invert_selection, width=50)
+                dpg.add_spacer(width=20)
+                dpg.add_button(label="^^", width=25, callback=trans_move_selected_top)
+                dpg.add_button(label="^", width=25, callback=trans_move_selected_up)
+                dpg.add_button(label="v", width=25, callback=trans_move_selected_down)
+                dpg.add_button(label="vv", width=25, callback=trans_move_selected_bottom)
+                dpg.add_spacer(width=10)
+                dpg.add_button(label="Dupe", width=45, callback=trans_duplicate_selected)
+                dpg.add_button(label="Del", width=40, callback=trans_delete_selected)
+            dpg.add_separator()
             with dpg.child_window(height=-30, tag="trans_manager_list"):
                 pass
 
@@ -88,6 +179,22 @@ def setup_transition_tab(parent):
                 readonly=True
             )
 
+    _manager_list = VirtualSelectableList(
+        "trans_manager_list",
+        trans_manager_select_callback,
+        width=800,
+        label_prefix="preset_"
+    )
+    _builder_list = VirtualSelectableList(
+        "trans_builder_list",
+        trans_builder_select_callback,
+        width=230
+    )
+
+    # Resolve panel tags once; mode switches configure them by id
+    for mode_name in ("BUILDER", "MANAGER", "JSON"):
+        _panels[mode_name] = dpg.get_alias_id(f"trans_{mode_name.lower()}_panel")
+
 
 # =============================================================================
 # Mode Switching
@@ -95,15 +202,13 @@ def setup_transition_tab(parent):
 
 def switch_transition_mode(mode):
     """Switch between Builder, Manager, and JSON modes."""
+    if mode == _app.transition_mode:
+        return
     _app.transition_mode = mode
 
     # Show/hide panels
-    if dpg.does_item_exist("trans_builder_panel"):
-        dpg.configure_item("trans_builder_panel", show=(mode == _EditorMode.BUILDER))
-    if dpg.does_item_exist("trans_manager_panel"):
-        dpg.configure_item("trans_manager_panel", show=(mode == _EditorMode.MANAGER))
-    if dpg.does_item_exist("trans_json_panel"):
-        dpg.configure_item("trans_json_panel", show=(mode == _EditorMode.JSON))
+    for mode_name, panel in _panels.items():
+        dpg.configure_item(panel, show=(mode.name == mode_name))
 
     refresh_transition_ui()
 
@@ -114,6 +219,8 @@ def switch_transition_mode(mode):
 
 def refresh_transition_ui():
     """Refresh transition tab content based on current mode."""
+    if not _app.ui_ready:
+        return
     if _app.transition_mode == _EditorMode.MANAGER:
         refresh_transition_manager()
     elif _app.transition_mode == _EditorMode.BUILDER:
@@ -123,46 +230,15 @@ def refresh_transition_ui():
 
 
 def refresh_transition_manager():
-    """Refresh the transition manager list."""
-    if not dpg.does_item_exist("trans_manager_list"):
+    """Refresh the transition manager list (visible rows are diffed in place)."""
+    if _manager_list is None:
         return
 
-    dpg.delete_item("trans_manager_list", children_only=True)
-
     names = _app.json_mgr.get_transition_names()
     selected = _app.trans_selection.selected
 
-    # Top toolbar: selection + actions
-    with dpg.group(horizontal=True, parent="trans_manager_list"):
-        dpg.add_text(f"Selected: {len(selected)} of {len(names)}")
-        dpg.add_spacer(width=10)
-        dpg.add_button(label="All", callback=trans_select_all, width=40)
-        dpg.add_button(label="None", callback=trans_select_none, width=45)
-        dpg.add_button(label="Invert", callback=trans_invert_selection, width=50)
-        dpg.add_spacer(width=20)
-        dpg.add_button(label="^^", width=25, callback=trans_move_selected_top)
-        dpg.add_button(label="^", width=25, callback=trans_move_selected_up)
-        dpg.add_button(label="v", width=25, callback=trans_move_selected_down)
-        dpg.add_button(label="vv", width=25, callback=trans_move_selected_bottom)
-        dpg.add_spacer(width=10)
-        dpg.add_button(label="Dupe", width=45, callback=trans_duplicate_selected)
-        dpg.add_button(label="Del", width=40, callback=trans_delete_selected)
-
-    dpg.add_separator(parent="trans_manager_list")
-
-    # Selectable list
-    for name in names:
-        is_selected = name in selected
-        prefix = "[*] " if is_selected else "    "
-        item_id = dpg.add_selectable(
-            label=f"{prefix}preset_{name}",
-            default_value=is_selected,
-            callback=trans_manager_select_callback,
-            user_data=name,
-            width=800,
-            parent="trans_manager_list"
-        )
-        apply_selection_theme(item_id, is_selected)
+    dpg.set_value("trans_manager_count", f"Selected: {len(selected)} of {len(names)}")
+    _manager_list.set_items(names, selected)
 
 
 def refresh_transition_builder():
@@ -173,74 +249,98 @@ def refresh_transition_builder():
 
 def refresh_transition_builder_list():
     """Refresh the transition builder list panel."""
-    if not dpg.does_item_exist("trans_builder_list"):
+    if _builder_list is None:
         return
-
-    dpg.delete_item("trans_builder_list", children_only=True)
-
-    presets = _app.json_mgr.get_transition_names()
-    for name in presets:
-        is_selected = name in _app.trans_selection.selected
-        prefix = "[*] " if is_selected else "    "
-        item_id = dpg.add_selectable(
-            label=f"{prefix}{name}",
-            default_value=is_selected,
-            callback=trans_builder_select_callback,
-            user_data=name,
-            width=230,
-            parent="trans_builder_list"
-        )
-        apply_selection_theme(item_id, is_selected)
+    _builder_list.set_items(_app.json_mgr.get_transition_names(), _app.trans_selection.selected)
 
 
 def refresh_transition_builder_content():
-    """Refresh the transition builder content/editor panel."""
+    """Refresh the transition builder content/editor panel.
+
+    The editor widgets are built once. Selecting another preset rebinds
+    their user_data and values, and position sections whose align/offset
+    mode flipped are relabeled in place.
+    """
+    global _builder_layout
+
     if not dpg.does_item_exist("trans_builder_content"):
         return
 
-    dpg.delete_item("trans_builder_content", children_only=True)
+    name = _app.trans_selection.single()
+    preset = _app.json_mgr.get_transition(name) if name else None
 
-    selected = _app.trans_selection.selected
-    if len(selected) != 1:
-        dpg.add_text("Select a single preset to edit",
-                    parent="trans_builder_content")
+    if name is None:
+        _show_builder_message("Select a single preset to edit")
         return
-
-    name = selected[0]
-    preset = _app.json_mgr.get_transition(name)
     if not preset:
-        dpg.add_text(f"Preset '{name}' not found",
-                    parent="trans_builder_content")
+        _show_builder_message(f"Preset '{name}' not found")
         return
 
-    parent = "trans_builder_content"
+    values = _transition_builder_values(name, preset)
+    if not dpg.does_item_exist("trans_builder_editor"):
+        _build_transition_editor(name, values)
+    else:
+        if _builder_layout[0] != name:
+            for field, data in _builder_user_data(name).items():
+                dpg.configure_item(_builder_tag(field), user_data=data)
+        if values["start_align"] != _builder_layout[1]:
+            _apply_position_mode("start", values["start_align"])
+        if values["end_align"] != _builder_layout[2]:
+            _apply_position_mode("end", values["end_align"])
+        for field, value in values.items():
+            dpg.set_value(_builder_tag(field), value)
+
+    _builder_layout = (name, values["start_align"], values["end_align"])
+    if dpg.does_item_exist("trans_builder_message"):
+        dpg.hide_item("trans_builder_message")
+    dpg.show_item("trans_builder_editor")
+
+
+def _show_builder_message(text: str):
+    """Hide the editor widgets and show a message in their place."""
+    if dpg.does_item_exist("trans_builder_editor"):
+        dpg.hide_item("trans_builder_editor")
+    if dpg.does_item_exist("trans_builder_message"):
+        dpg.set_value("trans_builder_message", text)
+        dpg.show_item("trans_builder_message")
+    else:
+        dpg.add_text(text, parent="trans_builder_content", tag="trans_builder_message")
+
+
+def _build_transition_editor(name: str, values: Dict[str, Any]):
+    """Create the builder editor widgets, bound to the named preset."""
+    bound = _builder_user_data(name)
+    parent = dpg.add_group(parent="trans_builder_content", tag="trans_builder_editor")
 
     # Editable preset name with Update button
     with dpg.group(horizontal=True, parent=parent):
         dpg.add_text("Preset Name:")
-        name_input = dpg.add_input_text(
+        dpg.add_input_text(
             default_value=name,
             callback=trans_rename_callback,
-            user_data=name,
+            user_data=bound["name"],
             on_enter=True,
-            width=150
+            width=150,
+            tag=_builder_tag("name")
         )
         dpg.add_button(
             label="Update Name",
             callback=trans_update_name_button_callback,
-            user_data=(name, name_input)
+            user_data=bound["update_name"],
+            tag=_builder_tag("update_name")
         )
     dpg.add_separator(parent=parent)
 
     # Duration
     dpg.add_input_float(
         label="Duration",
-        default_value=preset.get("duration", 0.4),
+        default_value=values["duration"],
         callback=trans_field_callback,
-        user_data=(name, "duration"),
+        user_data=bound["duration"],
         min_value=0.0, max_value=5.0, step=0.1,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("duration")
     )
 
     # Easing
@@ -248,171 +348,182 @@ def refresh_transition_builder_content():
     dpg.add_combo(
         label="Easing",
         items=easing_options,
-        default_value=preset.get("easing", "easeout"),
+        default_value=values["easing"],
         callback=trans_field_callback,
-        user_data=(name, "easing"),
+        user_data=bound["easing"],
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("easing")
     )
 
     # Start Position
     dpg.add_separator(parent=parent)
-    start_pos = preset.get("start_position", {})
-    start_is_align = "xalign" in start_pos or "yalign" in start_pos
+    start_is_align = values["start_align"]
 
     with dpg.group(horizontal=True, parent=parent):
         dpg.add_text("Start Position")
         dpg.add_spacer(width=10)
-        dpg.add_text("Offset", color=(150, 255, 150) if not start_is_align else (150, 150, 150))
+        dpg.add_text("Offset", color=(150, 255, 150) if not start_is_align else (150, 150, 150),
+                     tag=_builder_tag("start_offset_label"))
         dpg.add_checkbox(
             label="",
             default_value=start_is_align,
             callback=trans_toggle_start_callback,
-            user_data=name,
+            user_data=bound["start_align"],
+            tag=_builder_tag("start_align")
         )
-        dpg.add_text("Align", color=(150, 255, 150) if start_is_align else (150, 150, 150))
+        dpg.add_text("Align", color=(150, 255, 150) if start_is_align else (150, 150, 150),
+                     tag=_builder_tag("start_align_label"))
 
-    x_key = "xalign" if start_is_align else "xoffset"
-    x_value = start_pos.get("xalign", start_pos.get("xoffset", 0.0))
     dpg.add_input_float(
-        label=x_key,
-        default_value=x_value,
+        label="xalign" if start_is_align else "xoffset",
+        default_value=values["start_x"],
         callback=trans_update_start_x_callback,
-        user_data=name,
+        user_data=bound["start_x"],
         step=0.1 if start_is_align else 10.0,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("start_x")
     )
 
-    y_key = "yalign" if start_is_align else "yoffset"
-    y_value = start_pos.get("yalign", start_pos.get("yoffset", 0.0))
     dpg.add_input_float(
-        label=y_key,
-        default_value=y_value,
+        label="yalign" if start_is_align else "yoffset",
+        default_value=values["start_y"],
         callback=trans_update_start_y_callback,
-        user_data=name,
+        user_data=bound["start_y"],
         step=0.1 if start_is_align else 10.0,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("start_y")
     )
 
     # End Position
     dpg.add_separator(parent=parent)
-    end_pos = preset.get("end_position", {})
-    end_is_align = "xalign" in end_pos or "yalign" in end_pos
+    end_is_align = values["end_align"]
 
     with dpg.group(horizontal=True, parent=parent):
         dpg.add_text("End Position")
         dpg.add_spacer(width=10)
-        dpg.add_text("Offset", color=(150, 255, 150) if not end_is_align else (150, 150, 150))
+        dpg.add_text("Offset", color=(150, 255, 150) if not end_is_align else (150, 150, 150),
+                     tag=_builder_tag("end_offset_label"))
         dpg.add_checkbox(
             label="",
             default_value=end_is_align,
             callback=trans_toggle_end_callback,
-            user_data=name,
+            user_data=bound["end_align"],
+            tag=_builder_tag("end_align")
         )
-        dpg.add_text("Align", color=(150, 255, 150) if end_is_align else (150, 150, 150))
+        dpg.add_text("Align", color=(150, 255, 150) if end_is_align else (150, 150, 150),
+                     tag=_builder_tag("end_align_label"))
 
-    x_key = "xalign" if end_is_align else "xoffset"
-    x_value = end_pos.get("xalign", end_pos.get("xoffset", 0.0))
     dpg.add_input_float(
-        label=x_key,
-        default_value=x_value,
+        label="xalign" if end_is_align else "xoffset",
+        default_value=values["end_x"],
         callback=trans_update_end_x_callback,
-        user_data=name,
+        user_data=bound["end_x"],
         step=0.1 if end_is_align else 10.0,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("end_x")
     )
 
-    y_key = "yalign" if end_is_align else "yoffset"
-    y_value = end_pos.get("yalign", end_pos.get("yoffset", 0.0))
     dpg.add_input_float(
-        label=y_key,
-        default_value=y_value,
+        label="yalign" if end_is_align else "yoffset",
+        default_value=values["end_y"],
         callback=trans_update_end_y_callback,
-        user_data=name,
+        user_data=bound["end_y"],
         step=0.1 if end_is_align else 10.0,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("end_y")
     )
 
     # Alpha
     dpg.add_separator(parent=parent)
     dpg.add_text("Alpha", parent=parent)
-    alpha = preset.get("alpha", {"start": 1.0, "end": 1.0})
     dpg.add_input_float(
         label="Alpha Start",
-        default_value=alpha.get("start", 1.0),
+        default_value=values["alpha_start"],
         callback=trans_nested_callback,
-        user_data=(name, "alpha", "start"),
+        user_data=bound["alpha_start"],
         min_value=0.0, max_value=1.0, step=0.1,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("alpha_start")
     )
     dpg.add_input_float(
         label="Alpha End",
-        default_value=alpha.get("end", 1.0),
+        default_value=values["alpha_end"],
         callback=trans_nested_callback,
-        user_data=(name, "alpha", "end"),
+        user_data=bound["alpha_end"],
         min_value=0.0, max_value=1.0, step=0.1,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("alpha_end")
     )
 
     # Scale
     dpg.add_separator(parent=parent)
     dpg.add_text("Scale", parent=parent)
-    scale = preset.get("scale", {"start": 1.0, "end": 1.0})
     dpg.add_input_float(
         label="Scale Start",
-        default_value=scale.get("start", 1.0),
+        default_value=values["scale_start"],
         callback=trans_nested_callback,
-        user_data=(name, "scale", "start"),
+        user_data=bound["scale_start"],
         min_value=0.0, max_value=3.0, step=0.1,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("scale_start")
     )
     dpg.add_input_float(
         label="Scale End",
-        default_value=scale.get("end", 1.0),
+        default_value=values["scale_end"],
         callback=trans_nested_callback,
-        user_data=(name, "scale", "end"),
+        user_data=bound["scale_end"],
         min_value=0.0, max_value=3.0, step=0.1,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("scale_end")
     )
 
     # Rotation
     dpg.add_separator(parent=parent)
     dpg.add_text("Rotation", parent=parent)
-    rotation = preset.get("rotation", {"start": 0, "end": 0})
     dpg.add_input_int(
         label="Rotation Start",
-        default_value=int(rotation.get("start", 0)),
+        default_value=values["rotation_start"],
         callback=trans_nested_callback,
-        user_data=(name, "rotation", "start"),
+        user_data=bound["rotation_start"],
         min_value=-360, max_value=360, step=15,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("rotation_start")
     )
     dpg.add_input_int(
         label="Rotation End",
-        default_value=int(rotation.get("end", 0)),
+        default_value=values["rotation_end"],
         callback=trans_nested_callback,
-        user_data=(name, "rotation", "end"),
+        user_data=bound["rotation_end"],
         min_value=-360, max_value=360, step=15,
         width=150,
-        parent=parent
+        parent=parent,
+        tag=_builder_tag("rotation_end")
     )
 
 
 def refresh_transition_json():
-    """Refresh the transition JSON view."""
-    import json
-    if dpg.does_item_exist("trans_json_text"):
-        text = json.dumps(_app.json_mgr.transition_data, indent=2)
-        dpg.set_value("trans_json_text", text)
+    """Refresh the transition JSON view (only while the JSON panel is shown)."""
+    global _json_cache
+    if _app.transition_mode != _EditorMode.JSON:
+        return
+    if not dpg.does_item_exist("trans_json_text"):
+        return
+
+    # Re-serialize only when the data changed since the last refresh
+    revision = _app.json_mgr.revision
+    if _json_cache[0] != revision:
+        _json_cache = (revision, to_display_json(_app.json_mgr.transition_data))
+        dpg.set_value("trans_json_text", _json_cache[1])
 
 
 # =============================================================================
@@ -426,8 +537,7 @@ def trans_manager_select_callback(sender, app_data, user_data):
 
 def trans_manager_select(name: str):
     """Handle selection in manager mode."""
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
-    shift = dpg.is_key_down(dpg.mvKey_LShift) or dpg.is_key_down(dpg.mvKey_RShift)
+    ctrl, shift = modifier_state()
     _app.trans_selection.handle_click(name, ctrl, shift)
     refresh_transition_manager()
 
@@ -439,22 +549,18 @@ def trans_builder_select_callback(sender, app_data, user_data):
 
 def trans_builder_select(name: str):
     """Select a preset in builder mode."""
-    ctrl = dpg.is_key_down(dpg.mvKey_LControl) or dpg.is_key_down(dpg.mvKey_RControl)
+    ctrl = is_ctrl_down()
     old_selection = list(_app.trans_selection.selected)
 
     if ctrl:
-        if name in _app.trans_selection.selected:
-            _app.trans_selection.selected.remove(name)
-        else:
-            _app.trans_selection.selected.append(name)
+        _app.trans_selection.toggle(name)
     else:
-        _app.trans_selection.selected = [name]
+        _app.trans_selection.select([name])
 
     refresh_transition_builder_list()
 
     # Only refresh content if selection actually changed
-    # This prevents destroying widgets before their callbacks fire
-    if _app.trans_selection.selected != old_selection:
+    if list(_app.trans_selection.selected) != old_selection:
         refresh_transition_builder_content()
 
 
@@ -482,26 +588,22 @@ def trans_invert_selection():
 # =============================================================================
 
 def trans_move_selected_top():
-    for name in reversed(_app.trans_selection.selected):
-        _app.json_mgr.move_transition(name, "top")
+    _app.json_mgr.move_transitions(_app.trans_selection.selected, "top")
     refresh_transition_manager()
 
 
 def trans_move_selected_up():
-    for name in _app.trans_selection.selected:
-        _app.json_mgr.move_transition(name, "up")
+    _app.json_mgr.move_transitions(_app.trans_selection.selected, "up")
     refresh_transition_manager()
 
 
 def trans_move_selected_down():
-    for name in reversed(_app.trans_selection.selected):
-        _app.json_mgr.move_transition(name, "down")
+    _app.json_mgr.move_transitions(_app.trans_selection.selected, "down")
     refresh_transition_manager()
 
 
 def trans_move_selected_bottom():
-    for name in _app.trans_selection.selected:
-        _app.json_mgr.move_transition(name, "bottom")
+    _app.json_mgr.move_transitions(_app.trans_selection.selected, "bottom")
     refresh_transition_manager()
 
 
@@ -511,10 +613,11 @@ def trans_move_selected_bottom():
 
 def trans_duplicate_selected():
     from modules.ui_components import show_confirm_dialog
-    selected = _app.trans_selection.selected.copy()
-    for name in selected:
-        new_name = _app.json_mgr.get_unique_transition_name(f"{name}_copy")
-        _app.json_mgr.duplicate_transition(name, new_name)
+    selected = list(_app.trans_selection.selected)
+    with _app.json_mgr.batch():
+        for name in selected:
+            new_name = _app.json_mgr.get_unique_transition_name(f"{name}_copy")
+            _app.json_mgr.duplicate_transition(name, new_name)
     _app.trans_selection.update_items(_app.json_mgr.get_transition_names())
     refresh_transition_manager()
     if _update_status_bar:
@@ -523,13 +626,13 @@ def trans_duplicate_selected():
 
 def trans_delete_selected():
     from modules.ui_components import show_confirm_dialog
-    selected = _app.trans_selection.selected.copy()
+    selected = list(_app.trans_selection.selected)
     if not selected:
         return
 
     def do_delete():
         _app.json_mgr.delete_transitions(selected)
-        _app.trans_selection.selected = []
+        _app.trans_selection.select_none()
         _app.trans_selection.update_items(_app.json_mgr.get_transition_names())
         refresh_transition_manager()
         if _update_status_bar:
@@ -557,7 +660,7 @@ def add_new_transition():
         "easing": "easeout"
     })
     _app.trans_selection.update_items(_app.json_mgr.get_transition_names())
-    _app.trans_selection.selected = [name]
+    _app.trans_selection.select([name])
     refresh_transition_ui()
     if _update_status_bar:
         _update_status_bar()
@@ -626,83 +729,50 @@ def trans_update_end_y_callback(sender, app_data, user_data):
 
 def trans_update_field(name: str, field: str, value):
     """Update a simple field on a transition preset."""
-    preset = _app.json_mgr.get_transition(name) or {}
-    preset[field] = value
-    _app.json_mgr.set_transition(name, preset)
+    with _app.json_mgr.mutate_transition(name, field) as preset:
+        preset[field] = value
     if _update_status_bar:
         _update_status_bar()
 
 
 def trans_update_nested(name: str, category: str, key: str, value):
     """Update a nested field (alpha.start, scale.end, etc.)."""
-    preset = _app.json_mgr.get_transition(name) or {}
-    if category not in preset:
-        preset[category] = {}
-    preset[category][key] = value
-    _app.json_mgr.set_transition(name, preset)
+    with _app.json_mgr.mutate_transition(name, (category, key)) as preset:
+        preset.setdefault(category, {})[key] = value
     if _update_status_bar:
         _update_status_bar()
 
 
 def trans_toggle_section_mode(name: str, pos_type: str, use_align: bool):
     """Toggle between align (0-1) and offset (pixels) mode for a position section."""
-    preset = _app.json_mgr.get_transition(name)
-    if preset is None:
-        preset = {}
-
-    if pos_type not in preset:
-        preset[pos_type] = {}
-
-    pos = preset[pos_type]
-
-    # Handle X axis
-    x_value = pos.get("xalign", pos.get("xoffset", 0.0))
-    pos.pop("xoffset", None)
-    pos.pop("xalign", None)
-    if use_align:
-        if x_value > 1.0 or x_value < 0.0:
-            x_value = 0.5
-        pos["xalign"] = x_value
-    else:
-        if 0.0 < x_value <= 1.0:
-            x_value = 0.0
-        pos["xoffset"] = x_value
-
-    # Handle Y axis
-    y_value = pos.get("yalign", pos.get("yoffset", 0.0))
-    pos.pop("yoffset", None)
-    pos.pop("yalign", None)
-    if use_align:
-        if y_value > 1.0 or y_value < 0.0:
-            y_value = 1.0
-        pos["yalign"] = y_value
-    else:
-        if 0.0 < y_value <= 1.0:
-            y_value = 0.0
-        pos["yoffset"] = y_value
+    with _app.json_mgr.mutate_transition(name) as preset:
+        pos = preset.setdefault(pos_type, {})
+        # Align values outside 0-1 reset to the axis default; offsets inside (0, 1] reset to 0
+        for axis, align_default in (("x", 0.5), ("y", 1.0)):
+            align = pos.pop(f"{axis}align", None)
+            offset = pos.pop(f"{axis}offset", 0.0)
+            value = offset if align is None else align
+            if use_align:
+                pos[f"{axis}align"] = value if 0.0 <= value <= 1.0 else align_default
+            else:
+                pos[f"{axis}offset"] = 0.0 if 0.0 < value <= 1.0 else value
 
-    _app.json_mgr.set_transition(name, preset)
     if _update_status_bar:
         _update_status_bar()
-    refresh_transition_builder()
+    refresh_transition_builder_content()
 
 
 def trans_update_position_smart(name: str, pos_type: str, axis: str, value: float):
     """Update position value, using current mode (align or offset)."""
-    preset = _app.json_mgr.get_transition(name) or {}
-    if pos_type not in preset:
-        preset[pos_type] = {}
-
-    pos = preset[pos_type]
     offset_key = f"{axis}offset"
     align_key = f"{axis}align"
 
-    if align_key in pos:
-        pos[align_key] = _clean_float(value)
-    else:
-        pos[offset_key] = _clean_float(value)
-
-    _app.json_mgr.set_transition(name, preset)
+    with _app.json_mgr.mutate_transition(name, (pos_type, axis)) as preset:
+        pos = preset.setdefault(pos_type, {})
+        if align_key in pos:
+            pos[align_key] = _clean_float(value)
+        else:
+            pos[offset_key] = _clean_float(value)
     if _update_status_bar:
         _update_status_bar()
 
@@ -712,14 +782,9 @@ def trans_rename_preset(old_name: str, new_name: str):
     new_name = new_name.strip()
     if not new_name or new_name == old_name:
         return
-    if _app.json_mgr.get_transition(new_name):
-        return
-    preset = _app.json_mgr.get_transition(old_name)
-    if preset:
-        _app.json_mgr.set_transition(new_name, preset)
-        _app.json_mgr.delete_transition(old_name)
+    if _app.json_mgr.rename_transition(old_name, new_name):
         _app.trans_selection.update_items(_app.json_mgr.get_transition_names())
-        _app.trans_selection.selected = [new_name]
+        _app.trans_selection.select([new_name])
         refresh_transition_ui()
         if _update_status_bar:
             _update_status_bar()
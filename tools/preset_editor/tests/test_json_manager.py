@@ -0,0 +1,63 @@
+"""
+test_json_manager.py - Tests for JsonManager undo snapshots
+
+Run from tools/preset_editor:
+    python -m unittest discover tests
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.json_manager import JsonManager
+
+
+class TestUndoNonFinite(unittest.TestCase):
+    """NaN/Infinity must survive undo snapshots (orjson writes them as null)."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.shader_path = os.path.join(self.tmp.name, "shader_presets.json")
+        with open(self.shader_path, "w", encoding="utf-8") as f:
+            f.write('{"shader_presets": {"glow": {"shader": "glow", '
+                    '"params": {"u_a": NaN, "u_b": Infinity, "u_c": 0.5}}}}')
+        self.mgr = JsonManager()
+        self.mgr.set_paths("", self.shader_path)
+        self.mgr.load()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assert_non_finite_kept(self, params):
+        self.assertTrue(math.isnan(params["u_a"]))
+        self.assertEqual(params["u_b"], math.inf)
+
+    def test_nan_round_trips_through_undo_and_redo(self):
+        self.mgr.push_undo("Edit glow")
+        self.mgr.shader_data["shader_presets"]["glow"]["params"]["u_c"] = 1.0
+
+        self.assertTrue(self.mgr.undo())
+        params = self.mgr.get_shader("glow")["params"]
+        self.assert_non_finite_kept(params)
+        self.assertEqual(params["u_c"], 0.5)
+
+        self.assertTrue(self.mgr.redo())
+        self.assert_non_finite_kept(self.mgr.get_shader("glow")["params"])
+
+    def test_undo_saves_nan_back_to_file(self):
+        self.mgr.push_undo("Edit glow")
+        self.mgr.shader_data["shader_presets"]["glow"]["params"]["u_c"] = 1.0
+        self.mgr.undo()
+
+        with open(self.shader_path, encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assert_non_finite_kept(saved["shader_presets"]["glow"]["params"])
+
+
+if __name__ == "__main__":
+    unittest.main()